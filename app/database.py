@@ -7,9 +7,11 @@ import sqlite3
 import json
 import os
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
 from pathlib import Path
-import pandas as pd
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 # Support for NAS/Docker deployment with environment variable
 # Database is stored in a persistent location that won't be deleted
@@ -42,7 +44,9 @@ def get_db_connection():
             _db_pool.pop(thread_id, None)
 
     # Create new connection
-    conn = sqlite3.connect(DB_PATH, timeout=20.0, check_same_thread=False)
+    conn = sqlite3.connect(
+        DB_PATH, timeout=20.0, check_same_thread=False, cached_statements=256
+    )
     conn.row_factory = sqlite3.Row
 
     # Enable WAL mode for better concurrent performance
@@ -263,9 +267,6 @@ def init_database():
     )
 
     # Add indexes for sessions
-    cursor.execute(
-        "CREATE INDEX IF NOT EXISTS idx_sessions_filename ON sessions_metadata(filename)"
-    )
     cursor.execute(
         "CREATE INDEX IF NOT EXISTS idx_sessions_role ON sessions_metadata(role)"
     )
@@ -305,7 +306,6 @@ def init_database():
     )
 
     # Create indexes for better performance
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_videos_video_id ON videos(video_id)")
     cursor.execute(
         "CREATE INDEX IF NOT EXISTS idx_videos_playlist_id ON videos(playlist_id)"
     )
@@ -324,12 +324,6 @@ def init_database():
     cursor.execute(
         "CREATE INDEX IF NOT EXISTS idx_audio_track ON audio_files(track_number)"
     )
-    cursor.execute(
-        "CREATE INDEX IF NOT EXISTS idx_audio_filename ON audio_files(filename)"
-    )
-    cursor.execute(
-        "CREATE INDEX IF NOT EXISTS idx_posts_video_id ON social_media_posts(video_id)"
-    )
     cursor.execute(
         "CREATE INDEX IF NOT EXISTS idx_posts_platform ON social_media_posts(platform)"
     )
@@ -342,12 +336,6 @@ def init_database():
     cursor.execute(
         "CREATE INDEX IF NOT EXISTS idx_playlists_role ON playlists(playlist_role)"
     )
-    cursor.execute(
-        "CREATE INDEX IF NOT EXISTS idx_settings_key ON settings(setting_key)"
-    )
-    cursor.execute(
-        "CREATE INDEX IF NOT EXISTS idx_channel_pub_video_id ON channel_publications(video_id)"
-    )
     cursor.execute(
         "CREATE INDEX IF NOT EXISTS idx_channel_pub_target ON channel_publications(target_channel)"
     )
@@ -355,24 +343,67 @@ def init_database():
         "CREATE INDEX IF NOT EXISTS idx_channel_pub_status ON channel_publications(publication_status)"
     )
 
+    # These duplicated the automatic indexes behind UNIQUE constraints (or a
+    # leading column of one), so every insert paid for an extra b-tree update
+    for index_name in (
+        "idx_videos_video_id",
+        "idx_posts_video_id",
+        "idx_settings_key",
+        "idx_sessions_filename",
+        "idx_audio_filename",
+        "idx_channel_pub_video_id",
+    ):
+        cursor.execute(f"DROP INDEX IF EXISTS {index_name}")
+
     conn.commit()
+
+    # Refresh planner statistics (only re-analyzes tables that need it)
+    conn.execute("PRAGMA optimize")
     conn.close()
     print("✅ Database initialized successfully")
 
 
-def insert_or_update_video(video_data: Dict[str, Any]) -> int:
-    """Insert or update video in database."""
-    conn = get_db_connection()
+# Hot-path statements, kept as constants so the same SQL text is passed on
+# every call and hits the connection's prepared-statement cache
+_VIDEO_UPSERT_SQL = """
+    INSERT OR REPLACE INTO videos (
+        video_id, playlist_id, playlist_name, title, description, tags,
+        youtube_schedule_date, youtube_published_date, privacy_status,
+        video_type, role, custom_tags, youtube_url, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+"""
+
+_SOCIAL_POST_UPSERT_SQL = """
+    INSERT OR REPLACE INTO social_media_posts (
+        video_id, platform, post_content, schedule_date,
+        actual_scheduled_date, status, post_id, error_message, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+"""
+
+_POST_STATUS_UPDATE_SQL = """
+    UPDATE social_media_posts 
+    SET status = ?, actual_scheduled_date = ?, post_id = ?, 
+        error_message = ?, updated_at = CURRENT_TIMESTAMP
+    WHERE video_id = ? AND platform = ?
+"""
+
+
+def insert_or_update_video(
+    video_data: Dict[str, Any], conn: Optional[sqlite3.Connection] = None
+) -> int:
+    """
+    Insert or update video in database.
+
+    Pass a shared connection to batch many writes into one transaction; the
+    caller then owns the commit and close.
+    """
+    owns_conn = conn is None
+    if owns_conn:
+        conn = get_db_connection()
     cursor = conn.cursor()
 
     cursor.execute(
-        """
-        INSERT OR REPLACE INTO videos (
-            video_id, playlist_id, playlist_name, title, description, tags,
-            youtube_schedule_date, youtube_published_date, privacy_status,
-            video_type, role, custom_tags, youtube_url, updated_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-    """,
+        _VIDEO_UPSERT_SQL,
         (
             video_data.get("video_id"),
             video_data.get("playlist_id"),
@@ -390,26 +421,32 @@ def insert_or_update_video(video_data: Dict[str, Any]) -> int:
         ),
     )
 
-    conn.commit()
     video_db_id = cursor.lastrowid
-    conn.close()
+    if owns_conn:
+        conn.commit()
+        conn.close()
     return video_db_id
 
 
 def insert_or_update_social_post(
-    video_id: str, platform: str, post_data: Dict[str, Any]
+    video_id: str,
+    platform: str,
+    post_data: Dict[str, Any],
+    conn: Optional[sqlite3.Connection] = None,
 ) -> int:
-    """Insert or update social media post."""
-    conn = get_db_connection()
+    """
+    Insert or update social media post.
+
+    Pass a shared connection to batch many writes into one transaction; the
+    caller then owns the commit and close.
+    """
+    owns_conn = conn is None
+    if owns_conn:
+        conn = get_db_connection()
     cursor = conn.cursor()
 
     cursor.execute(
-        """
-        INSERT OR REPLACE INTO social_media_posts (
-            video_id, platform, post_content, schedule_date,
-            actual_scheduled_date, status, post_id, error_message, updated_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-    """,
+        _SOCIAL_POST_UPSERT_SQL,
         (
             video_id,
             platform,
@@ -422,9 +459,10 @@ def insert_or_update_social_post(
         ),
     )
 
-    conn.commit()
     post_db_id = cursor.lastrowid
-    conn.close()
+    if owns_conn:
+        conn.commit()
+        conn.close()
     return post_db_id
 
 
@@ -497,93 +535,97 @@ def update_post_status(
     actual_scheduled_date: Optional[str] = None,
     post_id: Optional[str] = None,
     error_message: Optional[str] = None,
+    conn: Optional[sqlite3.Connection] = None,
 ):
-    """Update social media post status."""
-    conn = get_db_connection()
+    """
+    Update social media post status.
+
+    Pass a shared connection to batch many updates into one transaction; the
+    caller then owns the commit and close.
+    """
+    owns_conn = conn is None
+    if owns_conn:
+        conn = get_db_connection()
     cursor = conn.cursor()
 
     cursor.execute(
-        """
-        UPDATE social_media_posts 
-        SET status = ?, actual_scheduled_date = ?, post_id = ?, 
-            error_message = ?, updated_at = CURRENT_TIMESTAMP
-        WHERE video_id = ? AND platform = ?
-    """,
+        _POST_STATUS_UPDATE_SQL,
         (status, actual_scheduled_date, post_id, error_message, video_id, platform),
     )
 
-    conn.commit()
-    conn.close()
+    if owns_conn:
+        conn.commit()
+        conn.close()
 
 
-def get_videos_for_export(playlist_id: Optional[str] = None) -> pd.DataFrame:
+def record_post_result(
+    video_id: str,
+    platform: str,
+    result: Dict[str, Any],
+    conn: Optional[sqlite3.Connection] = None,
+):
+    """Record a poster result dict (success/status/post_id/error) on its post."""
+    if result.get("success"):
+        update_post_status(
+            video_id,
+            platform,
+            result.get("status", "scheduled"),
+            result.get("scheduled_date"),
+            result.get("post_id"),
+            conn=conn,
+        )
+    else:
+        update_post_status(
+            video_id, platform, "error", error_message=result.get("error"), conn=conn
+        )
+
+
+# Column layout shared by the DataFrame and streaming Excel exports
+_EXPORT_SELECT = """
+    SELECT 
+        v.video_id as "Video Name",
+        v.title as "Title",
+        v.description as "Description",
+        v.tags as "Tags",
+        COALESCE(v.youtube_schedule_date, v.youtube_published_date) as "Schedule/Published Date",
+        v.video_type as "Type",
+        v.role as "Role",
+        v.custom_tags as "Custom Tags",
+        v.playlist_name as "Playlist Name",
+        v.youtube_url as "YouTube URL",
+        smp_linkedin.post_content as "LinkedIn Post",
+        smp_facebook.post_content as "Facebook Post",
+        smp_instagram.post_content as "Instagram Post",
+        smp_linkedin.schedule_date as "LinkedIn Schedule Date",
+        smp_facebook.schedule_date as "Facebook Schedule Date",
+        smp_instagram.schedule_date as "Instagram Schedule Date",
+        smp_linkedin.actual_scheduled_date as "LinkedIn Actual Scheduled Date",
+        smp_facebook.actual_scheduled_date as "Facebook Actual Scheduled Date",
+        smp_instagram.actual_scheduled_date as "Instagram Actual Scheduled Date",
+        smp_linkedin.status as "LinkedIn Status",
+        smp_facebook.status as "Facebook Status",
+        smp_instagram.status as "Instagram Status"
+    FROM videos v
+    LEFT JOIN social_media_posts smp_linkedin ON v.video_id = smp_linkedin.video_id AND smp_linkedin.platform = 'linkedin'
+    LEFT JOIN social_media_posts smp_facebook ON v.video_id = smp_facebook.video_id AND smp_facebook.platform = 'facebook'
+    LEFT JOIN social_media_posts smp_instagram ON v.video_id = smp_instagram.video_id AND smp_instagram.platform = 'instagram'
+"""
+
+
+def get_videos_for_export(playlist_id: Optional[str] = None) -> "pd.DataFrame":
     """Get videos as pandas DataFrame for Excel export."""
+    # pandas is heavy to import, so load it only when a DataFrame is needed
+    import pandas as pd
+
     conn = get_db_connection()
 
     if playlist_id:
-        query = """
-            SELECT 
-                v.video_id as "Video Name",
-                v.title as "Title",
-                v.description as "Description",
-                v.tags as "Tags",
-                COALESCE(v.youtube_schedule_date, v.youtube_published_date) as "Schedule/Published Date",
-                v.video_type as "Type",
-                v.role as "Role",
-                v.custom_tags as "Custom Tags",
-                v.playlist_name as "Playlist Name",
-                v.youtube_url as "YouTube URL",
-                smp_linkedin.post_content as "LinkedIn Post",
-                smp_facebook.post_content as "Facebook Post",
-                smp_instagram.post_content as "Instagram Post",
-                smp_linkedin.schedule_date as "LinkedIn Schedule Date",
-                smp_facebook.schedule_date as "Facebook Schedule Date",
-                smp_instagram.schedule_date as "Instagram Schedule Date",
-                smp_linkedin.actual_scheduled_date as "LinkedIn Actual Scheduled Date",
-                smp_facebook.actual_scheduled_date as "Facebook Actual Scheduled Date",
-                smp_instagram.actual_scheduled_date as "Instagram Actual Scheduled Date",
-                smp_linkedin.status as "LinkedIn Status",
-                smp_facebook.status as "Facebook Status",
-                smp_instagram.status as "Instagram Status"
-            FROM videos v
-            LEFT JOIN social_media_posts smp_linkedin ON v.video_id = smp_linkedin.video_id AND smp_linkedin.platform = 'linkedin'
-            LEFT JOIN social_media_posts smp_facebook ON v.video_id = smp_facebook.video_id AND smp_facebook.platform = 'facebook'
-            LEFT JOIN social_media_posts smp_instagram ON v.video_id = smp_instagram.video_id AND smp_instagram.platform = 'instagram'
-            WHERE v.playlist_id = ?
-            ORDER BY v.created_at DESC
-        """
+        query = (
+            _EXPORT_SELECT + " WHERE v.playlist_id = ? ORDER BY v.created_at DESC"
+        )
         df = pd.read_sql_query(query, conn, params=(playlist_id,))
     else:
-        query = """
-            SELECT 
-                v.video_id as "Video Name",
-                v.title as "Title",
-                v.description as "Description",
-                v.tags as "Tags",
-                COALESCE(v.youtube_schedule_date, v.youtube_published_date) as "Schedule/Published Date",
-                v.video_type as "Type",
-                v.role as "Role",
-                v.custom_tags as "Custom Tags",
-                v.playlist_name as "Playlist Name",
-                v.youtube_url as "YouTube URL",
-                smp_linkedin.post_content as "LinkedIn Post",
-                smp_facebook.post_content as "Facebook Post",
-                smp_instagram.post_content as "Instagram Post",
-                smp_linkedin.schedule_date as "LinkedIn Schedule Date",
-                smp_facebook.schedule_date as "Facebook Schedule Date",
-                smp_instagram.schedule_date as "Instagram Schedule Date",
-                smp_linkedin.actual_scheduled_date as "LinkedIn Actual Scheduled Date",
-                smp_facebook.actual_scheduled_date as "Facebook Actual Scheduled Date",
-                smp_instagram.actual_scheduled_date as "Instagram Actual Scheduled Date",
-                smp_linkedin.status as "LinkedIn Status",
-                smp_facebook.status as "Facebook Status",
-                smp_instagram.status as "Instagram Status"
-            FROM videos v
-            LEFT JOIN social_media_posts smp_linkedin ON v.video_id = smp_linkedin.video_id AND smp_linkedin.platform = 'linkedin'
-            LEFT JOIN social_media_posts smp_facebook ON v.video_id = smp_facebook.video_id AND smp_facebook.platform = 'facebook'
-            LEFT JOIN social_media_posts smp_instagram ON v.video_id = smp_instagram.video_id AND smp_instagram.platform = 'instagram'
-            ORDER BY v.created_at DESC
-        """
+        query = _EXPORT_SELECT + " ORDER BY v.created_at DESC"
         df = pd.read_sql_query(query, conn)
 
     conn.close()
@@ -645,9 +687,17 @@ def log_activity(
     status: str = "success",
     message: str = "",
     details: Optional[str] = None,
+    conn: Optional[sqlite3.Connection] = None,
 ):
-    """Log individual activity/action."""
-    conn = get_db_connection()
+    """
+    Log individual activity/action.
+
+    Pass a shared connection to write the log in the caller's transaction;
+    the caller then owns the commit and close.
+    """
+    owns_conn = conn is None
+    if owns_conn:
+        conn = get_db_connection()
     cursor = conn.cursor()
 
     # Convert details to JSON string if it's a dict
@@ -674,8 +724,9 @@ def log_activity(
         ),
     )
 
-    conn.commit()
-    conn.close()
+    if owns_conn:
+        conn.commit()
+        conn.close()
 
 
 def get_activity_logs(
@@ -733,29 +784,50 @@ def get_scheduled_count_today(platform: str, date: Optional[str] = None) -> int:
     return result["count"] if result else 0
 
 
+def _append_export_rows(worksheet, cursor) -> None:
+    """Stream the rows of an executed export query into a write-only sheet."""
+    worksheet.append([col[0] for col in cursor.description])
+    for row in cursor:
+        worksheet.append(tuple(row))
+
+
 def export_to_excel(output_path: str, playlist_id: Optional[str] = None):
-    """Export videos to Excel file (for compatibility)."""
-    df = get_videos_for_export(playlist_id)
+    """
+    Export videos to Excel file (for compatibility).
+
+    Rows are streamed from SQLite straight into a write-only workbook, so
+    no DataFrame is built and memory stays flat for large exports.
+    """
+    from openpyxl import Workbook
+
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    workbook = Workbook(write_only=True)
 
     if playlist_id:
         # Single playlist - one sheet
-        with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-            df.to_excel(writer, sheet_name="Videos", index=False)
+        cursor.execute(
+            _EXPORT_SELECT + " WHERE v.playlist_id = ? ORDER BY v.created_at DESC",
+            (playlist_id,),
+        )
+        _append_export_rows(workbook.create_sheet("Videos"), cursor)
     else:
         # Multiple playlists - one sheet per playlist
-        conn = get_db_connection()
-        cursor = conn.cursor()
         cursor.execute(
             "SELECT DISTINCT playlist_id, playlist_name FROM videos ORDER BY playlist_name"
         )
         playlists = cursor.fetchall()
-        conn.close()
 
-        with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-            for pl_id, pl_name in playlists:
-                df_playlist = get_videos_for_export(pl_id)
-                sheet_name = pl_name[:31] if pl_name else f"Playlist_{pl_id[:8]}"
-                df_playlist.to_excel(writer, sheet_name=sheet_name, index=False)
+        for pl_id, pl_name in playlists:
+            sheet_name = pl_name[:31] if pl_name else f"Playlist_{pl_id[:8]}"
+            cursor.execute(
+                _EXPORT_SELECT + " WHERE v.playlist_id = ? ORDER BY v.created_at DESC",
+                (pl_id,),
+            )
+            _append_export_rows(workbook.create_sheet(sheet_name), cursor)
+
+    conn.close()
+    workbook.save(output_path)
 
     print(f"✅ Exported to {output_path}")
 
@@ -1,13 +1,39 @@
 """
 Facebook and Instagram Graph API helpers with proper error handling
 """
+import functools
 import requests
 import logging
+from requests.adapters import HTTPAdapter
 from typing import Dict, Optional, Tuple
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _get_session() -> requests.Session:
+    """
+    Get the shared requests session that keeps Graph API connections alive.
+
+    Built once per process so every FacebookInstagramAPI instance reuses the
+    same connection pool.
+
+    Transient 429/5xx responses are retried with backoff; urllib3 leaves POSTs
+    out of status retries by default so posts are never created twice.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]
+        ),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
 class FacebookInstagramAPI:
     """Helper class for Facebook and Instagram API operations"""
     
@@ -16,11 +42,12 @@ class FacebookInstagramAPI:
         self.page_id = page_id
         self.instagram_business_account_id = instagram_business_account_id
         self.base_url = "https://graph.facebook.com/v18.0"
+        self.session = _get_session()
     
     def verify_token(self) -> Tuple[bool, Optional[str]]:
         """Verify that the access token is valid"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/me",
                 params={"access_token": self.page_access_token},
                 timeout=10
@@ -52,7 +79,7 @@ class FacebookInstagramAPI:
                 "published": False  # Schedule it, don't publish immediately
             }
             
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/{self.page_id}/feed",
                 params=params,
                 timeout=30
@@ -63,7 +90,7 @@ class FacebookInstagramAPI:
             if response.status_code == 200 and 'id' in response_data:
                 post_id = response_data['id']
                 # Verify the post was created
-                verify_response = requests.get(
+                verify_response = self.session.get(
                     f"{self.base_url}/{post_id}",
                     params={"access_token": self.page_access_token, "fields": "id,message,created_time,scheduled_publish_time"},
                     timeout=10
@@ -143,7 +170,7 @@ class FacebookInstagramAPI:
                 # Note: Instagram doesn't support scheduled_publish_time in container creation
                 # You need to publish immediately or use a different approach
             
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/{self.instagram_business_account_id}/media",
                 params=container_params,
                 timeout=60
@@ -160,7 +187,7 @@ class FacebookInstagramAPI:
                     "creation_id": container_id
                 }
                 
-                publish_response = requests.post(
+                publish_response = self.session.post(
                     f"{self.base_url}/{self.instagram_business_account_id}/media_publish",
                     params=publish_params,
                     timeout=60
@@ -60,6 +60,92 @@ from app.validators import (
 )
 
 
+# Clickbait hooks by content type, built once instead of per generated post
+_CLICKBAIT_HOOKS = {
+    "system_design": (
+        "🚨 90% of candidates FAIL system design interviews because they don't know this...",
+        "⚠️ This ONE mistake in system design interviews costs candidates $50K+ in salary...",
+        "💥 Most engineers get REJECTED at FAANG because they miss this critical step...",
+        "🔥 FAANG interviewers reject 8/10 candidates who don't understand this...",
+        "⚡️ This system design mistake made a candidate lose a $300K offer...",
+        "🎯 The #1 reason candidates fail system design interviews (and how to avoid it)...",
+        "💔 I've seen 100+ candidates fail because they didn't know this system design secret...",
+        "🚫 Don't make this fatal system design mistake that cost someone their dream job...",
+    ),
+    "behavioral": (
+        "😱 This behavioral interview mistake made a candidate lose a $200K offer...",
+        "⚠️ 85% of candidates FAIL behavioral interviews because they tell stories wrong...",
+        "💥 Most engineers get REJECTED because they can't answer this behavioral question...",
+        "🔥 FAANG interviewers reject candidates who don't structure stories this way...",
+        "⚡️ This ONE behavioral mistake cost someone their Amazon offer...",
+        "🎯 The #1 reason candidates fail behavioral interviews (it's not what you think)...",
+        "💔 I've coached 100+ people - this is the behavioral mistake that kills offers...",
+        "🚫 Don't make this fatal behavioral mistake that cost someone their dream job...",
+    ),
+    "coding": (
+        "🚨 95% of candidates FAIL coding interviews because they don't optimize this way...",
+        "⚠️ This coding interview mistake costs candidates $100K+ in total compensation...",
+        "💥 Most engineers get REJECTED at FAANG because they miss this optimization...",
+        "🔥 FAANG interviewers reject 9/10 candidates who don't think about this...",
+        "⚡️ This coding mistake made a candidate lose a $400K offer...",
+        "🎯 The #1 reason candidates fail coding interviews (and the simple fix)...",
+        "💔 I've seen 200+ candidates fail because they didn't know this coding pattern...",
+        "🚫 Don't make this fatal coding mistake that cost someone their dream job...",
+    ),
+    "salary": (
+        "💰 This salary negotiation mistake cost someone $80K per year...",
+        "⚠️ 90% of candidates leave $100K+ on the table because they don't negotiate this way...",
+        "💥 Most engineers accept LOW offers because they don't know this negotiation secret...",
+        "🔥 This ONE negotiation mistake cost someone a $300K total comp increase...",
+        "⚡️ I've helped clients unlock $4M+ in salary - here's the #1 mistake to avoid...",
+        "🎯 The salary negotiation mistake that costs engineers $50K-$200K per year...",
+        "💔 Don't make this negotiation mistake that cost someone their dream compensation...",
+        "🚫 This salary negotiation error made someone lose $150K in total comp...",
+    ),
+    "resume": (
+        "📄 This resume mistake makes recruiters REJECT 90% of applications...",
+        "⚠️ Most engineers' resumes get filtered out because they miss this critical element...",
+        "💥 This ONE resume mistake cost someone 50+ interview rejections...",
+        "🔥 FAANG recruiters reject resumes that don't have this...",
+        "⚡️ This resume error made a candidate lose 20+ interview opportunities...",
+        "🎯 The #1 resume mistake that gets your application filtered out immediately...",
+        "💔 I've reviewed 500+ resumes - this is the mistake that kills your chances...",
+        "🚫 Don't make this fatal resume mistake that cost someone their dream job...",
+    ),
+    "generic": (
+        "🚨 90% of candidates FAIL interviews because they don't prepare this way...",
+        "⚠️ This interview mistake costs candidates $50K-$200K in lost opportunities...",
+        "💥 Most engineers get REJECTED because they don't know this interview secret...",
+        "🔥 FAANG interviewers reject 8/10 candidates who miss this critical step...",
+        "⚡️ This interview mistake made a candidate lose a $300K offer...",
+        "🎯 The #1 reason candidates fail interviews (and how to avoid it)...",
+        "💔 I've coached 100+ people - this is the mistake that kills offers...",
+        "🚫 Don't make this fatal interview mistake that cost someone their dream job...",
+    ),
+}
+
+# Urgency and scarcity lines appended to platform posts
+_URGENCY_HOOKS = (
+    "⏰ Limited spots available for 1-on-1 coaching",
+    "🔥 Only a few coaching slots left this week",
+    "⚡️ Book your session before spots fill up",
+    "🎯 Don't wait - interviews are happening NOW",
+    "💥 Secure your coaching slot before it's too late",
+)
+
+# Platform-specific "watch" line label
+_WATCH_LABELS = {
+    "linkedin": "👉 Watch the full breakdown",
+    "facebook": "👉 Watch here",
+    "instagram": "▶️ Watch",
+}
+
+_COACHING_CTA = (
+    "📅 Book 1-on-1 coaching: https://fullstackmaster/book\n"
+    "💬 WhatsApp: +1-609-442-4081"
+)
+
+
 def generate_clickbait_post(
     title: str,
     description: str,
@@ -67,6 +153,7 @@ def generate_clickbait_post(
     video_role: str,
     platform: str,
     youtube_url: str,
+    hashtags: str = None,
 ) -> str:
     """
     Generate clickbait-style social media posts using psychological triggers:
@@ -74,149 +161,67 @@ def generate_clickbait_post(
     - Threat of missing opportunities
     - Failure stories and consequences
     - Urgency and scarcity
+
+    Pass precomputed hashtags when generating posts for several platforms
+    from the same video.
     """
     import random
 
     # Extract key pain points from title/description
     text_lower = f"{title} {description}".lower()
 
-    # Identify interview type and pain points
-    is_system_design = any(
+    # Identify interview type and pick the matching hook set
+    if any(
         kw in text_lower
         for kw in ["system design", "architecture", "scalability", "distributed"]
-    )
-    is_behavioral = any(
+    ):
+        hook_type = "system_design"
+    elif any(
         kw in text_lower for kw in ["behavioral", "leadership", "stories", "situation"]
-    )
-    is_coding = any(
+    ):
+        hook_type = "behavioral"
+    elif any(
         kw in text_lower for kw in ["coding", "leetcode", "algorithm", "programming"]
-    )
-    is_salary = any(
+    ):
+        hook_type = "coding"
+    elif any(
         kw in text_lower for kw in ["salary", "negotiation", "compensation", "offer"]
-    )
-    is_resume = any(kw in text_lower for kw in ["resume", "cv", "application"])
-
-    # Clickbait hooks based on content type
-    hooks = []
-
-    if is_system_design:
-        hooks = [
-            "🚨 90% of candidates FAIL system design interviews because they don't know this...",
-            "⚠️ This ONE mistake in system design interviews costs candidates $50K+ in salary...",
-            "💥 Most engineers get REJECTED at FAANG because they miss this critical step...",
-            "🔥 FAANG interviewers reject 8/10 candidates who don't understand this...",
-            "⚡️ This system design mistake made a candidate lose a $300K offer...",
-            "🎯 The #1 reason candidates fail system design interviews (and how to avoid it)...",
-            "💔 I've seen 100+ candidates fail because they didn't know this system design secret...",
-            "🚫 Don't make this fatal system design mistake that cost someone their dream job...",
-        ]
-    elif is_behavioral:
-        hooks = [
-            "😱 This behavioral interview mistake made a candidate lose a $200K offer...",
-            "⚠️ 85% of candidates FAIL behavioral interviews because they tell stories wrong...",
-            "💥 Most engineers get REJECTED because they can't answer this behavioral question...",
-            "🔥 FAANG interviewers reject candidates who don't structure stories this way...",
-            "⚡️ This ONE behavioral mistake cost someone their Amazon offer...",
-            "🎯 The #1 reason candidates fail behavioral interviews (it's not what you think)...",
-            "💔 I've coached 100+ people - this is the behavioral mistake that kills offers...",
-            "🚫 Don't make this fatal behavioral mistake that cost someone their dream job...",
-        ]
-    elif is_coding:
-        hooks = [
-            "🚨 95% of candidates FAIL coding interviews because they don't optimize this way...",
-            "⚠️ This coding interview mistake costs candidates $100K+ in total compensation...",
-            "💥 Most engineers get REJECTED at FAANG because they miss this optimization...",
-            "🔥 FAANG interviewers reject 9/10 candidates who don't think about this...",
-            "⚡️ This coding mistake made a candidate lose a $400K offer...",
-            "🎯 The #1 reason candidates fail coding interviews (and the simple fix)...",
-            "💔 I've seen 200+ candidates fail because they didn't know this coding pattern...",
-            "🚫 Don't make this fatal coding mistake that cost someone their dream job...",
-        ]
-    elif is_salary:
-        hooks = [
-            "💰 This salary negotiation mistake cost someone $80K per year...",
-            "⚠️ 90% of candidates leave $100K+ on the table because they don't negotiate this way...",
-            "💥 Most engineers accept LOW offers because they don't know this negotiation secret...",
-            "🔥 This ONE negotiation mistake cost someone a $300K total comp increase...",
-            "⚡️ I've helped clients unlock $4M+ in salary - here's the #1 mistake to avoid...",
-            "🎯 The salary negotiation mistake that costs engineers $50K-$200K per year...",
-            "💔 Don't make this negotiation mistake that cost someone their dream compensation...",
-            "🚫 This salary negotiation error made someone lose $150K in total comp...",
-        ]
-    elif is_resume:
-        hooks = [
-            "📄 This resume mistake makes recruiters REJECT 90% of applications...",
-            "⚠️ Most engineers' resumes get filtered out because they miss this critical element...",
-            "💥 This ONE resume mistake cost someone 50+ interview rejections...",
-            "🔥 FAANG recruiters reject resumes that don't have this...",
-            "⚡️ This resume error made a candidate lose 20+ interview opportunities...",
-            "🎯 The #1 resume mistake that gets your application filtered out immediately...",
-            "💔 I've reviewed 500+ resumes - this is the mistake that kills your chances...",
-            "🚫 Don't make this fatal resume mistake that cost someone their dream job...",
-        ]
+    ):
+        hook_type = "salary"
+    elif any(kw in text_lower for kw in ["resume", "cv", "application"]):
+        hook_type = "resume"
     else:
         # Generic hooks for interview prep
-        hooks = [
-            "🚨 90% of candidates FAIL interviews because they don't prepare this way...",
-            "⚠️ This interview mistake costs candidates $50K-$200K in lost opportunities...",
-            "💥 Most engineers get REJECTED because they don't know this interview secret...",
-            "🔥 FAANG interviewers reject 8/10 candidates who miss this critical step...",
-            "⚡️ This interview mistake made a candidate lose a $300K offer...",
-            "🎯 The #1 reason candidates fail interviews (and how to avoid it)...",
-            "💔 I've coached 100+ people - this is the mistake that kills offers...",
-            "🚫 Don't make this fatal interview mistake that cost someone their dream job...",
-        ]
+        hook_type = "generic"
 
     # Select a random hook
-    hook = random.choice(hooks)
+    hook = random.choice(_CLICKBAIT_HOOKS[hook_type])
 
     # Extract value proposition from title
     value_prop = title
     if len(value_prop) > 80:
         value_prop = value_prop[:77] + "..."
 
-    # Create urgency and scarcity elements
-    urgency_hooks = [
-        "⏰ Limited spots available for 1-on-1 coaching",
-        "🔥 Only a few coaching slots left this week",
-        "⚡️ Book your session before spots fill up",
-        "🎯 Don't wait - interviews are happening NOW",
-        "💥 Secure your coaching slot before it's too late",
-    ]
-    urgency = random.choice(urgency_hooks)
-
     # Platform-specific formatting
-    if platform == "linkedin":
-        post = f"{hook}\n\n"
-        post += f"💡 {value_prop}\n\n"
-        post += f"👉 Watch the full breakdown: {youtube_url}\n\n"
-        post += f"📅 Book 1-on-1 coaching: https://fullstackmaster/book\n"
-        post += f"💬 WhatsApp: +1-609-442-4081\n\n"
-        post += f"{urgency}\n\n"
-        post += generate_hashtags_for_rupesh(video_type, video_role, title, description)
-
-    elif platform == "facebook":
-        post = f"{hook}\n\n"
-        post += f"💡 {value_prop}\n\n"
-        post += f"👉 Watch here: {youtube_url}\n\n"
-        post += f"📅 Book 1-on-1 coaching: https://fullstackmaster/book\n"
-        post += f"💬 WhatsApp: +1-609-442-4081\n\n"
-        post += f"{urgency}\n\n"
-        post += generate_hashtags_for_rupesh(video_type, video_role, title, description)
-
-    elif platform == "instagram":
-        post = f"{hook}\n\n"
-        post += f"💡 {value_prop}\n\n"
-        post += f"▶️ Watch: {youtube_url}\n\n"
-        post += f"📅 Book 1-on-1 coaching: https://fullstackmaster/book\n"
-        post += f"💬 WhatsApp: +1-609-442-4081\n\n"
-        post += f"{urgency}\n\n"
-        post += generate_hashtags_for_rupesh(video_type, video_role, title, description)
-
-    else:
-        post = f"{hook}\n\n{value_prop}\n\n{youtube_url}\n\n📅 Book 1-on-1 coaching: https://fullstackmaster/book\n💬 WhatsApp: +1-609-442-4081"
+    watch_label = _WATCH_LABELS.get(platform)
+    if watch_label:
+        urgency = random.choice(_URGENCY_HOOKS)
+        if hashtags is None:
+            hashtags = generate_hashtags_for_rupesh(
+                video_type, video_role, title, description
+            )
+        return "\n\n".join(
+            (
+                hook,
+                f"💡 {value_prop}",
+                f"{watch_label}: {youtube_url}",
+                _COACHING_CTA,
+                urgency,
+                hashtags,
+            )
+        )
 
-    return post
+    return "\n\n".join((hook, value_prop, youtube_url, _COACHING_CTA))
 
 
 def generate_hashtags_for_rupesh(
@@ -901,55 +906,89 @@ def run_daily_automation():
             if use_database:
                 # Post from database (more efficient)
                 from app.database import get_pending_posts
-                from post_to_social_media import SocialMediaPoster
 
-                poster = SocialMediaPoster(
-                    use_ayrshare=bool(
-                        settings.get("api_keys", {}).get("ayrshare_api_key")
-                    )
+                # Each platform drains its own queue on its own thread, so
+                # case variants or repeats of the same platform in settings
+                # must collapse to one entry or its posts would go out twice
+                platforms = list(
+                    dict.fromkeys(platform.lower() for platform in platforms)
                 )
 
+                # Load every pending post in one query and group by platform
+                # so there's nothing to set up when all posts are already out
+                pending_by_platform = {}
+                for post in get_pending_posts():
+                    pending_by_platform.setdefault(post["platform"], []).append(post)
                 for platform in platforms:
-                    pending_posts = get_pending_posts(platform=platform.lower())
-                    print(f"Found {len(pending_posts)} pending posts for {platform}")
+                    print(
+                        f"Found {len(pending_by_platform.get(platform, []))} "
+                        f"pending posts for {platform}"
+                    )
+                platforms = [
+                    platform
+                    for platform in platforms
+                    if pending_by_platform.get(platform)
+                ]
+                use_ayrshare = bool(
+                    settings.get("api_keys", {}).get("ayrshare_api_key")
+                )
+
+                def post_platform_queue(platform):
+                    from app.database import record_post_result
+                    from post_to_social_media import SocialMediaPoster
 
+                    # One poster per thread; SocialMediaPoster keeps its own
+                    # HTTP session and auth state and isn't known to be
+                    # safe to share between threads
+                    poster = SocialMediaPoster(use_ayrshare=use_ayrshare)
+                    pending_posts = pending_by_platform[platform]
+
+                    last_post_at = None
                     for post in pending_posts:
                         video_id = post["video_id"]
                         content = post["post_content"]
                         schedule_date = post["schedule_date"]
 
+                        # Rate limiting: keep 2s between posts to the same platform
+                        if last_post_at is not None:
+                            wait = 2 - (time.monotonic() - last_post_at)
+                            if wait > 0:
+                                time.sleep(wait)
+                        last_post_at = time.monotonic()
+
                         # Post to platform
-                        if platform.lower() == "linkedin":
+                        if platform == "linkedin":
                             result = poster.post_to_linkedin(content, schedule_date)
-                        elif platform.lower() == "facebook":
+                        elif platform == "facebook":
                             result = poster.post_to_facebook(content, schedule_date)
-                        elif platform.lower() == "instagram":
+                        elif platform == "instagram":
                             result = poster.post_to_instagram(
                                 content, None, schedule_date
                             )
                         else:
                             continue
 
-                        # Update database
-                        from app.database import update_post_status
-
-                        if result.get("success"):
-                            update_post_status(
-                                video_id,
-                                platform.lower(),
-                                result.get("status", "scheduled"),
-                                result.get("scheduled_date"),
-                                result.get("post_id"),
-                            )
-                        else:
-                            update_post_status(
-                                video_id,
-                                platform.lower(),
-                                "error",
-                                error_message=result.get("error"),
-                            )
-
-                        time.sleep(2)  # Rate limiting
+                        # Commit each result on its own short transaction so no
+                        # write lock is held across network calls and a post
+                        # that went out is never left pending
+                        record_post_result(video_id, platform, result)
+
+                # Platforms are separate hosts, so post to them concurrently
+                # and only pace requests within each platform
+                if platforms:
+                    from concurrent.futures import ThreadPoolExecutor
+
+                    with ThreadPoolExecutor(
+                        max_workers=min(len(platforms), 12)
+                    ) as executor:
+                        for future in [
+                            executor.submit(post_platform_queue, platform)
+                            for platform in platforms
+                        ]:
+                            try:
+                                future.result()
+                            except Exception as e:
+                                print(f"Social media posting failed: {e}")
             else:
                 # Post from Excel (legacy)
                 excel_file = (
@@ -1869,18 +1908,27 @@ def get_my_channel_id_helper(youtube):
         return None
 
 
-def get_youtube_service():
-    """Get YouTube API service."""
-    try:
-        from google_auth_oauthlib.flow import InstalledAppFlow
-        from google.oauth2.credentials import Credentials
-        from google.auth.transport.requests import Request
-        from googleapiclient.discovery import build
+# Serialises token.json loads, refreshes and writes across threads
+_youtube_creds_lock = threading.Lock()
+
 
-        SCOPES = ["https://www.googleapis.com/auth/youtube.readonly"]
-        CLIENT_SECRET_FILE = "client_secret.json"
-        TOKEN_FILE = "token.json"
+def get_youtube_credentials():
+    """
+    Load, refresh or obtain the YouTube OAuth credentials.
+
+    Runs under a lock so concurrent callers never refresh and rewrite
+    token.json at the same time or start two OAuth servers on port 5001.
+    Returns None when no credentials can be obtained.
+    """
+    from google_auth_oauthlib.flow import InstalledAppFlow
+    from google.oauth2.credentials import Credentials
+    from google.auth.transport.requests import Request
 
+    SCOPES = ["https://www.googleapis.com/auth/youtube.readonly"]
+    CLIENT_SECRET_FILE = "client_secret.json"
+    TOKEN_FILE = "token.json"
+
+    with _youtube_creds_lock:
         creds = None
         if os.path.exists(TOKEN_FILE):
             creds = Credentials.from_authorized_user_file(TOKEN_FILE, SCOPES)
@@ -1899,15 +1947,102 @@ def get_youtube_service():
                 # See OAUTH_LONG_TERM_SETUP.md for details
                 creds = flow.run_local_server(port=5001, open_browser=True)
 
-            with open(TOKEN_FILE, "w", encoding="utf-8") as f:
+            # Swap the new token in atomically so no reader sees a partial file
+            tmp_file = TOKEN_FILE + ".tmp"
+            with open(tmp_file, "w", encoding="utf-8") as f:
                 f.write(creds.to_json())
+            os.replace(tmp_file, TOKEN_FILE)
+
+        return creds
+
+
+def build_youtube_service(creds):
+    """Build a YouTube API client around already-loaded credentials."""
+    from googleapiclient.discovery import build
+
+    # One AuthorizedHttp keeps the HTTPS connection alive across all
+    # calls made with this service instead of reconnecting per request
+    import google_auth_httplib2
+    import httplib2
 
-        return build("youtube", "v3", credentials=creds)
+    authed_http = google_auth_httplib2.AuthorizedHttp(
+        creds, http=httplib2.Http(timeout=30)
+    )
+    return build("youtube", "v3", http=authed_http, cache_discovery=False)
+
+
+def get_youtube_service():
+    """Get YouTube API service."""
+    try:
+        creds = get_youtube_credentials()
+        if not creds:
+            return None
+        return build_youtube_service(creds)
     except Exception as e:
         print(f"Error getting YouTube service: {e}")
         return None
 
 
+# Error reasons worth retrying; anything else (e.g. quotaExceeded, forbidden)
+# will not clear up by waiting
+_RETRYABLE_REASONS = frozenset(
+    ("rateLimitExceeded", "userRateLimitExceeded", "backendError", "internalServerError")
+)
+_RETRYABLE_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+
+def _http_error_reason(error) -> str:
+    """Get the first error reason from a googleapiclient HttpError body."""
+    try:
+        content = error.content
+        if isinstance(content, bytes):
+            content = content.decode("utf-8")
+        return json.loads(content)["error"]["errors"][0]["reason"]
+    except (AttributeError, KeyError, IndexError, TypeError, ValueError):
+        return ""
+
+
+def safe_execute(api_request, max_retries: int = 6):
+    """
+    Execute a googleapiclient request, retrying transient HTTP errors.
+
+    Retries wait with jittered exponential backoff (capped at 60s) so that
+    concurrent workers don't retry in lockstep; a Retry-After header from the
+    API takes precedence when present. Non-transient errors such as
+    quotaExceeded are raised immediately.
+    """
+    import random
+    from googleapiclient.errors import HttpError
+
+    last_status = None
+    for attempt in range(max_retries):
+        try:
+            return api_request.execute()
+        except HttpError as e:
+            last_status = e.resp.status
+            reason = _http_error_reason(e)
+            if reason == "quotaExceeded":
+                raise RuntimeError(
+                    "YouTube API quota exceeded; retry after the daily quota resets"
+                ) from e
+            if (
+                reason not in _RETRYABLE_REASONS
+                and last_status not in _RETRYABLE_STATUSES
+            ):
+                raise
+            if attempt == max_retries - 1:
+                raise RuntimeError(
+                    f"YouTube API request failed after {max_retries} attempts "
+                    f"(last status {last_status})"
+                ) from e
+
+            try:
+                delay = float(e.resp.get("retry-after"))
+            except (TypeError, ValueError):
+                delay = random.uniform(0.5, 1.5) * (2**attempt)
+            time.sleep(min(60, delay))
+
+
 def fetch_all_playlists_from_youtube(youtube, channel_id: str):
     """Fetch all playlists from YouTube."""
     playlists = []
@@ -1916,25 +2051,21 @@ def fetch_all_playlists_from_youtube(youtube, channel_id: str):
     while True:
         try:
             if page_token:
-                response = (
-                    youtube.playlists()
-                    .list(
+                response = safe_execute(
+                    youtube.playlists().list(
                         part="id,snippet,contentDetails",
                         channelId=channel_id,
                         maxResults=50,
                         pageToken=page_token,
                     )
-                    .execute()
                 )
             else:
-                response = (
-                    youtube.playlists()
-                    .list(
+                response = safe_execute(
+                    youtube.playlists().list(
                         part="id,snippet,contentDetails",
                         channelId=channel_id,
                         maxResults=50,
                     )
-                    .execute()
                 )
 
             for pl in response.get("items", []):
@@ -1963,127 +2094,204 @@ def fetch_all_playlists_from_youtube(youtube, channel_id: str):
     return playlists
 
 
+def fetch_video_details_from_youtube(youtube, video_ids, details_cache=None):
+    """
+    Fetch video resources (snippet + status) for the given IDs, 50 per call.
+
+    Results are stored in ``details_cache`` keyed by video ID. IDs already in
+    the cache are not requested again, so callers walking several playlists can
+    share one cache and fetch each video only once.
+    """
+    if details_cache is None:
+        details_cache = {}
+
+    missing_ids = [vid for vid in video_ids if vid not in details_cache]
+    for i in range(0, len(missing_ids), 50):
+        batch = missing_ids[i : i + 50]
+        videos_response = safe_execute(
+            youtube.videos().list(
+                part="id,snippet,status", id=",".join(batch), maxResults=50
+            )
+        )
+        for video in videos_response.get("items", []):
+            details_cache[video["id"]] = video
+
+    return details_cache
+
+
 def fetch_playlist_videos_from_youtube(
-    youtube, playlist_id: str, channel_title: str = ""
+    youtube, playlist_id: str, channel_title: str = "", details_cache=None
 ):
-    """Fetch all videos in a playlist from YouTube."""
+    """
+    Fetch all videos in a playlist from YouTube.
+
+    Pass a shared ``details_cache`` dict when fetching several playlists so
+    videos that appear in more than one playlist are only looked up once.
+    """
+    from datetime import datetime
+
     videos = []
+    video_ids = []
+    seen_ids = set()
     page_token = None
 
+    # Collect every video ID in the playlist first, then fetch details in
+    # full batches of 50 instead of one videos.list call per page
     while True:
         try:
             if page_token:
-                response = (
-                    youtube.playlistItems()
-                    .list(
+                response = safe_execute(
+                    youtube.playlistItems().list(
                         part="id,snippet,contentDetails",
                         playlistId=playlist_id,
                         maxResults=50,
                         pageToken=page_token,
                     )
-                    .execute()
                 )
             else:
-                response = (
-                    youtube.playlistItems()
-                    .list(
+                response = safe_execute(
+                    youtube.playlistItems().list(
                         part="id,snippet,contentDetails",
                         playlistId=playlist_id,
                         maxResults=50,
                     )
-                    .execute()
                 )
 
-            video_ids = [
-                item["contentDetails"]["videoId"] for item in response.get("items", [])
-            ]
+            # Skip videos that appear more than once in the playlist so their
+            # details are only fetched (and returned) once
+            for item in response.get("items", []):
+                vid = item["contentDetails"]["videoId"]
+                if vid and vid not in seen_ids:
+                    seen_ids.add(vid)
+                    video_ids.append(vid)
 
-            if video_ids:
-                # Get video details in batches
-                for i in range(0, len(video_ids), 50):
-                    batch = video_ids[i : i + 50]
-                    videos_response = (
-                        youtube.videos()
-                        .list(
-                            part="id,snippet,status", id=",".join(batch), maxResults=50
-                        )
-                        .execute()
-                    )
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                break
+        except Exception as e:
+            print(f"Error fetching playlist videos: {e}")
+            import traceback
 
-                    for video in videos_response.get("items", []):
-                        snippet = video.get("snippet", {})
-                        status = video.get("status", {})
-                        video_id = video["id"]
+            traceback.print_exc()
+            break
 
-                        # Get channel title from snippet
-                        channel_name = snippet.get("channelTitle", channel_title)
+    if details_cache is None:
+        details_cache = {}
 
-                        # Determine publish date vs schedule date
-                        published_at = snippet.get("publishedAt", "")
-                        publish_at = status.get("publishAt", "")
-                        privacy_status = status.get("privacyStatus", "")
+    try:
+        fetch_video_details_from_youtube(youtube, video_ids, details_cache)
+    except Exception as e:
+        print(f"Error fetching video details: {e}")
+        import traceback
 
-                        # Determine if scheduled (future date) or published
-                        from datetime import datetime
+        traceback.print_exc()
 
-                        is_scheduled = False
-                        display_date = published_at
-                        date_label = "Published"
+    for video_id in video_ids:
+        video = details_cache.get(video_id)
+        if not video:
+            continue
 
-                        if publish_at:
-                            try:
-                                pub_date = datetime.fromisoformat(
-                                    publish_at.replace("Z", "+00:00")
-                                )
-                                # If publishAt is in the future, it's scheduled
-                                if pub_date > datetime.now(pub_date.tzinfo):
-                                    is_scheduled = True
-                                    display_date = publish_at
-                                    date_label = "Scheduled"
-                            except:
-                                pass
+        snippet = video.get("snippet", {})
+        status = video.get("status", {})
 
-                        if privacy_status == "private" and publish_at:
-                            is_scheduled = True
-                            display_date = publish_at
-                            date_label = "Scheduled"
-                        elif privacy_status == "public":
-                            date_label = "Published"
-                            display_date = published_at
+        # Get channel title from snippet
+        channel_name = snippet.get("channelTitle", channel_title)
 
-                        videos.append(
-                            {
-                                "videoId": video_id,
-                                "title": snippet.get("title", ""),
-                                "description": snippet.get("description", ""),
-                                "thumbnail": snippet.get("thumbnails", {})
-                                .get("medium", {})
-                                .get("url", ""),
-                                "publishedAt": published_at,
-                                "publishAt": publish_at,
-                                "privacyStatus": privacy_status,
-                                "videoUrl": f"https://www.youtube.com/watch?v={video_id}",
-                                "tags": ", ".join(snippet.get("tags", [])),
-                                "channelTitle": channel_name,
-                                "displayDate": display_date,
-                                "dateLabel": date_label,
-                                "isScheduled": is_scheduled,
-                            }
-                        )
+        # Determine publish date vs schedule date
+        published_at = snippet.get("publishedAt", "")
+        publish_at = status.get("publishAt", "")
+        privacy_status = status.get("privacyStatus", "")
 
-            page_token = response.get("nextPageToken")
-            if not page_token:
-                break
-        except Exception as e:
-            print(f"Error fetching playlist videos: {e}")
-            import traceback
+        # Determine if scheduled (future date) or published
+        is_scheduled = False
+        display_date = published_at
+        date_label = "Published"
 
-            traceback.print_exc()
-            break
+        if publish_at:
+            try:
+                pub_date = datetime.fromisoformat(publish_at.replace("Z", "+00:00"))
+                # If publishAt is in the future, it's scheduled
+                if pub_date > datetime.now(pub_date.tzinfo):
+                    is_scheduled = True
+                    display_date = publish_at
+                    date_label = "Scheduled"
+            except:
+                pass
+
+        if privacy_status == "private" and publish_at:
+            is_scheduled = True
+            display_date = publish_at
+            date_label = "Scheduled"
+        elif privacy_status == "public":
+            date_label = "Published"
+            display_date = published_at
+
+        videos.append(
+            {
+                "videoId": video_id,
+                "title": snippet.get("title", ""),
+                "description": snippet.get("description", ""),
+                "thumbnail": snippet.get("thumbnails", {})
+                .get("medium", {})
+                .get("url", ""),
+                "publishedAt": published_at,
+                "publishAt": publish_at,
+                "privacyStatus": privacy_status,
+                "videoUrl": f"https://www.youtube.com/watch?v={video_id}",
+                "tags": ", ".join(snippet.get("tags", [])),
+                "channelTitle": channel_name,
+                "displayDate": display_date,
+                "dateLabel": date_label,
+                "isScheduled": is_scheduled,
+            }
+        )
 
     return videos
 
 
+def fetch_videos_for_playlists(playlists, details_cache=None, max_workers: int = 8):
+    """
+    Fetch the videos of several playlists concurrently.
+
+    Playlist paging is latency-bound, so playlists are fetched on a small
+    thread pool instead of one after another. Credentials are loaded once and
+    each worker builds its own YouTube client around them, because httplib2
+    connections are not thread-safe.
+    Returns a dict mapping playlist ID to its list of videos.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    if not playlists:
+        return {}
+    if details_cache is None:
+        details_cache = {}
+
+    # Load (and if needed refresh) the credentials once on this thread;
+    # workers only wrap them in a client of their own. A worker whose client
+    # fails to build raises instead of caching a dead client, so the error
+    # surfaces here rather than as silently empty playlists
+    creds = get_youtube_credentials()
+    if not creds:
+        raise RuntimeError("YouTube API not configured")
+
+    worker_state = threading.local()
+
+    def fetch_one(playlist):
+        if not hasattr(worker_state, "youtube"):
+            worker_state.youtube = build_youtube_service(creds)
+        return fetch_playlist_videos_from_youtube(
+            worker_state.youtube,
+            playlist["playlistId"],
+            playlist.get("channelTitle", ""),
+            details_cache,
+        )
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(playlists))) as executor:
+        results = list(executor.map(fetch_one, playlists))
+
+    return {pl["playlistId"]: videos for pl, videos in zip(playlists, results)}
+
+
 def get_video_social_posts_from_db(video_id: str):
     """Get social media posts for a video from database."""
     from app.database import get_db_connection
@@ -2355,7 +2563,6 @@ def api_shorts():
                         """,
                             (playlist_id, playlist_title, playlist_role, playlist_type),
                         )
-                        conn.commit()
                     except Exception as e:
                         app.logger.error(f"Error saving playlist tags: {e}")
 
@@ -2435,6 +2642,8 @@ def api_shorts():
                     p for p in shorts_playlists if p.get("type") == type_filter
                 ]
 
+            # Commit the derived playlist tags in one transaction
+            conn.commit()
             conn.close()
 
             # Calculate totals
@@ -4315,6 +4524,7 @@ def api_autopilot_run():
     """Run auto-pilot mode: select one video from each playlist and schedule on all channels."""
     try:
         from app.database import (
+            get_db_connection,
             log_activity,
             get_scheduled_count_today,
             insert_or_update_social_post,
@@ -4360,15 +4570,14 @@ def api_autopilot_run():
         role_levels = targeting.get("role_levels", [])
 
         # Import tagging functions for filtering
-        from app.tagging import derive_type_enhanced, derive_role_enhanced
+        from app.tagging import derive_type_and_role
         from app.database import get_video
 
         # Select one video from each playlist (with targeting filter)
+        playlist_videos = fetch_videos_for_playlists(shorts_playlists)
         for playlist in shorts_playlists:
             playlist_id = playlist["playlistId"]
-            videos = fetch_playlist_videos_from_youtube(
-                youtube, playlist_id, playlist.get("channelTitle", "")
-            )
+            videos = playlist_videos.get(playlist_id, [])
 
             if videos:
                 selected_video = None
@@ -4385,17 +4594,11 @@ def api_autopilot_run():
                         role = db_video.get("role", "")
                     else:
                         # Derive type and role from content
-                        video_type = derive_type_enhanced(
+                        video_type, role = derive_type_and_role(
                             playlist_title,
-                            video.get("title", ""),
-                            video.get("description", ""),
-                            video.get("tags", ""),
-                        )
-                        role = derive_role_enhanced(
-                            playlist_title,
-                            video.get("title", ""),
-                            video.get("description", ""),
-                            video.get("tags", ""),
+                            video["title"],
+                            video["description"],
+                            video["tags"],
                         )
 
                     # Apply targeting filters if targeting USA students
@@ -4434,12 +4637,42 @@ def api_autopilot_run():
                         }
                     )
 
-        # Schedule selected videos to all platforms (respecting thresholds)
+        # Calculate schedule date (next scheduled day/time) once - it is the
+        # same for every video and platform in this run
+        schedule_time = settings.get("scheduling", {}).get(
+            "social_media_schedule_time", "19:30"
+        )
+        schedule_day = settings.get("scheduling", {}).get("schedule_day", "wednesday")
+
+        # Calculate next occurrence
+        today = datetime.now(IST)
+        days_ahead = {
+            "monday": 0,
+            "tuesday": 1,
+            "wednesday": 2,
+            "thursday": 3,
+            "friday": 4,
+            "saturday": 5,
+            "sunday": 6,
+        }[schedule_day.lower()]
+        next_date = today + timedelta(days=(days_ahead - today.weekday()) % 7)
+        if next_date <= today:
+            next_date += timedelta(days=7)
+
+        schedule_datetime = f"{next_date.strftime('%Y-%m-%d')} {schedule_time}"
+
+        # Schedule selected videos to all platforms (respecting thresholds).
+        # Posts and activity logs are collected here and written in a single
+        # transaction after the loop; the daily counts are therefore tracked
+        # in memory instead of being re-read from activity_logs per post
         scheduled_count = 0
+        scheduled_today_by_platform = {}
+        pending_posts = []
+        pending_logs = []
         for item in selected_videos:
             video = item["video"]
             video_id = video["videoId"]
-            video_title = video.get("title", "")
+            video_title = video["title"]
             playlist_id = item["playlist_id"]
             playlist_name = item["playlist_name"]
 
@@ -4451,18 +4684,24 @@ def api_autopilot_run():
                 # Check threshold
                 platform_limit_key = f"{platform}_daily_limit"
                 daily_limit = thresholds.get(platform_limit_key, 25)
-                scheduled_today = get_scheduled_count_today(platform, today_str)
+                if platform not in scheduled_today_by_platform:
+                    scheduled_today_by_platform[platform] = get_scheduled_count_today(
+                        platform, today_str
+                    )
+                scheduled_today = scheduled_today_by_platform[platform]
 
                 if scheduled_today >= daily_limit:
-                    log_activity(
-                        "schedule_post",
-                        platform=platform,
-                        video_id=video_id,
-                        video_title=video_title,
-                        playlist_id=playlist_id,
-                        playlist_name=playlist_name,
-                        status="skipped",
-                        message=f"Daily limit reached ({scheduled_today}/{daily_limit})",
+                    pending_logs.append(
+                        dict(
+                            action_type="schedule_post",
+                            platform=platform,
+                            video_id=video_id,
+                            video_title=video_title,
+                            playlist_id=playlist_id,
+                            playlist_name=playlist_name,
+                            status="skipped",
+                            message=f"Daily limit reached ({scheduled_today}/{daily_limit})",
+                        )
                     )
                     activities.append(
                         {
@@ -4501,12 +4740,9 @@ def api_autopilot_run():
                     playlist_name = playlist.get("playlistTitle", "")
 
                     # Derive video type and role for better hashtags
-                    from app.tagging import derive_type_enhanced, derive_role_enhanced
+                    from app.tagging import derive_type_and_role
 
-                    video_type = derive_type_enhanced(
-                        playlist_name, title, description, tags
-                    )
-                    video_role = derive_role_enhanced(
+                    video_type, video_role = derive_type_and_role(
                         playlist_name, title, description, tags
                     )
 
@@ -4537,21 +4773,29 @@ def api_autopilot_run():
                         video_role=video_role,
                         platform=platform,
                         youtube_url=youtube_url,
+                        hashtags=hashtags,
                     )
 
                 # Validate platform credentials BEFORE scheduling
-                is_valid, error_message = validate_platform_credentials(platform)
+                is_valid, error_message = validate_platform_credentials(
+                    platform, settings
+                )
                 if not is_valid:
-                    log_activity(
-                        "schedule_post",
-                        platform=platform,
-                        video_id=video_id,
-                        video_title=video_title,
-                        playlist_id=playlist_id,
-                        playlist_name=playlist_name,
-                        status="error",
-                        message=f"Failed to schedule: {error_message}",
-                        details={"error": error_message, "validation_failed": True},
+                    pending_logs.append(
+                        dict(
+                            action_type="schedule_post",
+                            platform=platform,
+                            video_id=video_id,
+                            video_title=video_title,
+                            playlist_id=playlist_id,
+                            playlist_name=playlist_name,
+                            status="error",
+                            message=f"Failed to schedule: {error_message}",
+                            details={
+                                "error": error_message,
+                                "validation_failed": True,
+                            },
+                        )
                     )
                     activities.append(
                         {
@@ -4563,53 +4807,33 @@ def api_autopilot_run():
                     )
                     continue
 
-                # Calculate schedule date (next scheduled day/time)
-                schedule_time = settings.get("scheduling", {}).get(
-                    "social_media_schedule_time", "19:30"
-                )
-                schedule_day = settings.get("scheduling", {}).get(
-                    "schedule_day", "wednesday"
-                )
-
-                # Calculate next occurrence
-                today = datetime.now(IST)
-                days_ahead = {
-                    "monday": 0,
-                    "tuesday": 1,
-                    "wednesday": 2,
-                    "thursday": 3,
-                    "friday": 4,
-                    "saturday": 5,
-                    "sunday": 6,
-                }[schedule_day.lower()]
-                next_date = today + timedelta(days=(days_ahead - today.weekday()) % 7)
-                if next_date <= today:
-                    next_date += timedelta(days=7)
-
-                schedule_datetime = f"{next_date.strftime('%Y-%m-%d')} {schedule_time}"
-
-                # Save to database
-                insert_or_update_social_post(
-                    video_id,
-                    platform,
-                    {
-                        "post_content": post_content,
-                        "schedule_date": schedule_datetime,
-                        "status": "scheduled",
-                    },
+                # Save to database (written after the loop)
+                pending_posts.append(
+                    (
+                        video_id,
+                        platform,
+                        {
+                            "post_content": post_content,
+                            "schedule_date": schedule_datetime,
+                            "status": "scheduled",
+                        },
+                    )
                 )
 
-                log_activity(
-                    "schedule_post",
-                    platform=platform,
-                    video_id=video_id,
-                    video_title=video_title,
-                    playlist_id=playlist_id,
-                    playlist_name=playlist_name,
-                    status="success",
-                    message=f"Scheduled for {schedule_datetime}",
-                    details={"schedule_date": schedule_datetime},
+                pending_logs.append(
+                    dict(
+                        action_type="schedule_post",
+                        platform=platform,
+                        video_id=video_id,
+                        video_title=video_title,
+                        playlist_id=playlist_id,
+                        playlist_name=playlist_name,
+                        status="success",
+                        message=f"Scheduled for {schedule_datetime}",
+                        details={"schedule_date": schedule_datetime},
+                    )
                 )
+                scheduled_today_by_platform[platform] += 1
 
                 activities.append(
                     {
@@ -4621,6 +4845,22 @@ def api_autopilot_run():
                 )
                 scheduled_count += 1
 
+        # One shared connection and one commit for the whole run
+        conn = get_db_connection()
+        try:
+            for post_video_id, post_platform, post_data in pending_posts:
+                insert_or_update_social_post(
+                    post_video_id, post_platform, post_data, conn=conn
+                )
+            for log_entry in pending_logs:
+                log_activity(conn=conn, **log_entry)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
         return jsonify(
             {
                 "success": True,
@@ -4667,7 +4907,7 @@ def api_content_preview_videos():
     """Get all videos with their social media posts for content preview."""
     try:
         from app.database import get_db_connection, get_video
-        from app.tagging import derive_type_enhanced, derive_role_enhanced
+        from app.tagging import derive_type_and_role
 
         youtube = get_youtube_service()
         if not youtube:
@@ -4686,10 +4926,9 @@ def api_content_preview_videos():
         ]
 
         all_videos = []
+        playlist_videos = fetch_videos_for_playlists(shorts_playlists)
         for playlist in shorts_playlists:
-            videos = fetch_playlist_videos_from_youtube(
-                youtube, playlist["playlistId"], playlist.get("channelTitle", "")
-            )
+            videos = playlist_videos.get(playlist["playlistId"], [])
             for video in videos:
                 video_id = video["videoId"]
 
@@ -4707,23 +4946,20 @@ def api_content_preview_videos():
                 db_video = get_video(video_id)
 
                 # Extract video metadata (always needed)
-                title = video.get("title", "")
-                description = video.get("description", "")
-                tags = video.get("tags", "")
-                published_at = video.get("publishedAt", "")
+                title = video["title"]
+                description = video["description"]
+                tags = video["tags"]
+                published_at = video["publishedAt"]
                 youtube_url = f"https://youtube.com/watch?v={video_id}"
                 playlist_name = playlist.get("playlistTitle", "")
 
                 # Generate posts if not exist
                 if not social_posts or len(social_posts) == 0:
                     # Generate posts aligned with Rupesh's coaching expertise
-                    from app.tagging import derive_type_enhanced, derive_role_enhanced
+                    from app.tagging import derive_type_and_role
 
                     # Derive video type and role for better hashtags
-                    video_type = derive_type_enhanced(
-                        playlist_name, title, description, tags
-                    )
-                    video_role = derive_role_enhanced(
+                    video_type, video_role = derive_type_and_role(
                         playlist_name, title, description, tags
                     )
 
@@ -4754,6 +4990,7 @@ def api_content_preview_videos():
                         video_role=video_role,
                         platform="linkedin",
                         youtube_url=youtube_url,
+                        hashtags=hashtags,
                     )
 
                     facebook_post = generate_clickbait_post(
@@ -4763,6 +5000,7 @@ def api_content_preview_videos():
                         video_role=video_role,
                         platform="facebook",
                         youtube_url=youtube_url,
+                        hashtags=hashtags,
                     )
 
                     instagram_post = generate_clickbait_post(
@@ -4772,6 +5010,7 @@ def api_content_preview_videos():
                         video_role=video_role,
                         platform="instagram",
                         youtube_url=youtube_url,
+                        hashtags=hashtags,
                     )
 
                     social_posts = {
@@ -4837,13 +5076,17 @@ def api_content_preview_videos():
         return jsonify({"error": str(e), "traceback": traceback.format_exc()}), 500
 
 
-def validate_platform_credentials(platform: str) -> tuple[bool, str]:
+def validate_platform_credentials(platform: str, settings=None) -> tuple[bool, str]:
     """Validate that platform credentials are configured.
 
+    Pass already loaded settings when validating many posts in one run so the
+    settings row isn't re-read and re-parsed for each of them.
+
     Returns:
         (is_valid, error_message)
     """
-    settings = load_settings()
+    if settings is None:
+        settings = load_settings()
     api_keys = settings.get("api_keys", {})
     platform_lower = platform.lower()
 
@@ -4924,7 +5167,12 @@ def validate_platform_credentials(platform: str) -> tuple[bool, str]:
 def api_schedule_post():
     """Schedule a post manually with custom date/time. Actually creates the post on the platform."""
     try:
-        from app.database import insert_or_update_social_post, log_activity, get_video
+        from app.database import (
+            get_db_connection,
+            insert_or_update_social_post,
+            log_activity,
+            get_video,
+        )
         import requests
 
         data = request.json or {}
@@ -5085,25 +5333,8 @@ def api_schedule_post():
                 if not page_id or not page_access_token:
                     error_msg = "Facebook Page ID and Access Token are required"
                 else:
-                    # Convert schedule_datetime to Unix timestamp for Facebook
-                    from datetime import datetime
-
-                    # Handle both T-separated and space-separated formats
-                    try:
-                        # Try ISO format first (YYYY-MM-DDTHH:MM:SS or YYYY-MM-DDTHH:MM)
-                        schedule_dt = datetime.fromisoformat(
-                            schedule_datetime.replace("Z", "+00:00").split("+")[0]
-                        )
-                    except (ValueError, AttributeError):
-                        try:
-                            # Try space-separated format (YYYY-MM-DD HH:MM:SS or YYYY-MM-DD HH:MM)
-                            schedule_dt = datetime.strptime(
-                                schedule_datetime, "%Y-%m-%d %H:%M:%S"
-                            )
-                        except ValueError:
-                            schedule_dt = datetime.strptime(
-                                schedule_datetime, "%Y-%m-%d %H:%M"
-                            )
+                    # Convert schedule_datetime to Unix timestamp for Facebook,
+                    # reusing the datetime parsed during validation above
                     scheduled_publish_time = int(schedule_dt.timestamp())
 
                     # Facebook Graph API - create scheduled post
@@ -5185,31 +5416,37 @@ def api_schedule_post():
 
         # Only save to database and return success if API call succeeded
         if success:
-            # Save to database
-            insert_or_update_social_post(
-                video_id,
-                platform,
-                {
-                    "post_content": post_content,
-                    "schedule_date": schedule_datetime,
-                    "status": "scheduled",
-                    "platform_post_id": post_id,
-                },
-            )
+            # Save the post and its success log in one transaction
+            conn = get_db_connection()
+            try:
+                insert_or_update_social_post(
+                    video_id,
+                    platform,
+                    {
+                        "post_content": post_content,
+                        "schedule_date": schedule_datetime,
+                        "status": "scheduled",
+                        "platform_post_id": post_id,
+                    },
+                    conn=conn,
+                )
 
-            # Log activity as success
-            log_activity(
-                "schedule_post",
-                platform=platform,
-                video_id=video_id,
-                status="success",
-                message=f"Successfully scheduled on {platform} for {schedule_datetime}",
-                details={
-                    "schedule_date": schedule_datetime,
-                    "manual": True,
-                    "platform_post_id": post_id,
-                },
-            )
+                log_activity(
+                    "schedule_post",
+                    platform=platform,
+                    video_id=video_id,
+                    status="success",
+                    message=f"Successfully scheduled on {platform} for {schedule_datetime}",
+                    details={
+                        "schedule_date": schedule_datetime,
+                        "manual": True,
+                        "platform_post_id": post_id,
+                    },
+                    conn=conn,
+                )
+                conn.commit()
+            finally:
+                conn.close()
 
             return jsonify(
                 {
@@ -5276,7 +5513,12 @@ def api_schedule_post():
 def api_schedule_to_platform():
     """Quick schedule a video to a platform (Buffer.com style)."""
     try:
-        from app.database import insert_or_update_social_post, log_activity, get_video
+        from app.database import (
+            get_db_connection,
+            insert_or_update_social_post,
+            log_activity,
+            get_video,
+        )
         from datetime import datetime, timedelta
 
         data = request.json or {}
@@ -5315,29 +5557,35 @@ def api_schedule_to_platform():
         schedule_datetime = tomorrow.replace(hour=14, minute=0, second=0, microsecond=0)
         schedule_str = schedule_datetime.strftime("%Y-%m-%d %H:%M")
 
-        # Save to database
-        insert_or_update_social_post(
-            video_id,
-            platform,
-            {
-                "post_content": post_content,
-                "schedule_date": schedule_str,
-                "status": "scheduled",
-            },
-        )
+        # Save the post and its activity log in one transaction
+        conn = get_db_connection()
+        try:
+            insert_or_update_social_post(
+                video_id,
+                platform,
+                {
+                    "post_content": post_content,
+                    "schedule_date": schedule_str,
+                    "status": "scheduled",
+                },
+                conn=conn,
+            )
 
-        # Log activity
-        log_activity(
-            "quick_schedule",
-            platform=platform,
-            video_id=video_id,
-            status="success",
-            message=f"Quick scheduled on {platform} for {schedule_str}",
-            details={
-                "schedule_date": schedule_str,
-                "auto_generated": True,
-            },
-        )
+            log_activity(
+                "quick_schedule",
+                platform=platform,
+                video_id=video_id,
+                status="success",
+                message=f"Quick scheduled on {platform} for {schedule_str}",
+                details={
+                    "schedule_date": schedule_str,
+                    "auto_generated": True,
+                },
+                conn=conn,
+            )
+            conn.commit()
+        finally:
+            conn.close()
 
         return jsonify(
             {
@@ -5383,7 +5631,7 @@ def api_playlist_videos(playlist_id):
         videos = fetch_playlist_videos_from_youtube(youtube, playlist_id, channel_title)
 
         # Add social media posts and tags from database
-        from app.tagging import derive_type_enhanced, derive_role_enhanced, suggest_tags
+        from app.tagging import derive_type_and_role, suggest_tags
         from app.database import get_video
 
         for video in videos:
@@ -5402,13 +5650,7 @@ def api_playlist_videos(playlist_id):
                 playlist_title = (
                     ""  # We don't have playlist title here, but can get from context
                 )
-                video_type = derive_type_enhanced(
-                    playlist_title,
-                    video.get("title", ""),
-                    video.get("description", ""),
-                    video.get("tags", ""),
-                )
-                role = derive_role_enhanced(
+                video_type, role = derive_type_and_role(
                     playlist_title,
                     video.get("title", ""),
                     video.get("description", ""),
@@ -5570,7 +5812,6 @@ def content():
 def api_content_videos():
     """API endpoint to fetch videos with social media post status for content page."""
     from app.database import get_db_connection
-    import pandas as pd
 
     try:
         conn = get_db_connection()
@@ -5607,60 +5848,46 @@ def api_content_videos():
             ORDER BY COALESCE(v.youtube_schedule_date, v.youtube_published_date) DESC
         """
 
-        df = pd.read_sql_query(query, conn)
+        # Read rows straight off the cursor; building a DataFrame only to walk
+        # it with iterrows() materialized a Series per row
+        rows = conn.execute(query).fetchall()
         conn.close()
 
+        def platform_post(row, platform):
+            schedule_date = row[f"{platform}_schedule_date"]
+            return {
+                "status": row[f"{platform}_status"] or "not_scheduled",
+                "schedule_date": (
+                    str(schedule_date) if schedule_date is not None else ""
+                ),
+                "post_content": row[f"{platform}_post"] or "",
+            }
+
         videos = []
-        for _, row in df.iterrows():
+        for row in rows:
+            published_date = row["youtube_published_date"]
+            schedule_date = row["youtube_schedule_date"]
             video = {
-                "video_id": row.get("video_id", ""),
-                "title": row.get("title", ""),
-                "description": row.get("description", "") or "",
-                "tags": row.get("tags", "") or "",
-                "youtube_url": row.get("youtube_url", ""),
-                "video_type": row.get("video_type", "") or "",
-                "role": row.get("role", "") or "",
-                "custom_tags": row.get("custom_tags", "") or "",
-                "playlist_name": row.get("playlist_name", "") or "",
+                "video_id": row["video_id"],
+                "title": row["title"],
+                "description": row["description"] or "",
+                "tags": row["tags"] or "",
+                "youtube_url": row["youtube_url"],
+                "video_type": row["video_type"] or "",
+                "role": row["role"] or "",
+                "custom_tags": row["custom_tags"] or "",
+                "playlist_name": row["playlist_name"] or "",
                 "youtube_published_date": (
-                    str(row.get("youtube_published_date", ""))
-                    if pd.notna(row.get("youtube_published_date"))
-                    else ""
+                    str(published_date) if published_date is not None else ""
                 ),
                 "youtube_schedule_date": (
-                    str(row.get("youtube_schedule_date", ""))
-                    if pd.notna(row.get("youtube_schedule_date"))
-                    else ""
+                    str(schedule_date) if schedule_date is not None else ""
                 ),
-                "privacy_status": row.get("privacy_status", ""),
+                "privacy_status": row["privacy_status"],
                 "platforms": {
-                    "linkedin": {
-                        "status": row.get("linkedin_status", "") or "not_scheduled",
-                        "schedule_date": (
-                            str(row.get("linkedin_schedule_date", ""))
-                            if pd.notna(row.get("linkedin_schedule_date"))
-                            else ""
-                        ),
-                        "post_content": row.get("linkedin_post", "") or "",
-                    },
-                    "facebook": {
-                        "status": row.get("facebook_status", "") or "not_scheduled",
-                        "schedule_date": (
-                            str(row.get("facebook_schedule_date", ""))
-                            if pd.notna(row.get("facebook_schedule_date"))
-                            else ""
-                        ),
-                        "post_content": row.get("facebook_post", "") or "",
-                    },
-                    "instagram": {
-                        "status": row.get("instagram_status", "") or "not_scheduled",
-                        "schedule_date": (
-                            str(row.get("instagram_schedule_date", ""))
-                            if pd.notna(row.get("instagram_schedule_date"))
-                            else ""
-                        ),
-                        "post_content": row.get("instagram_post", "") or "",
-                    },
+                    "linkedin": platform_post(row, "linkedin"),
+                    "facebook": platform_post(row, "facebook"),
+                    "instagram": platform_post(row, "instagram"),
                 },
             }
             videos.append(video)
@@ -6251,6 +6478,17 @@ def api_upload_client_secret():
         )
 
 
+def _calendar_datetime_fields(dt):
+    """
+    Get the date, time and datetime strings of a calendar event.
+
+    Formats the datetime once with isoformat() and slices the date and time
+    out of it rather than running strftime twice more per event.
+    """
+    iso = dt.isoformat()
+    return {"date": iso[:10], "time": iso[11:19], "datetime": iso}
+
+
 @app.route("/api/calendar-data")
 def api_calendar_data():
     """API endpoint for calendar data - shows only SHORTS from playlists with 'shorts' in name, with cross-platform status."""
@@ -6277,21 +6515,27 @@ def api_calendar_data():
                     if "shorts" in p.get("playlistTitle", "").lower()
                 ]
 
+                # Fetch all playlists in parallel; the per-video database
+                # lookups below stay on this thread. If the fetch fails, log
+                # it and still show the database-backed events below
+                try:
+                    playlist_videos = fetch_videos_for_playlists(shorts_playlists)
+                except Exception as e:
+                    app.logger.error(f"Error fetching calendar playlists: {e}")
+                    playlist_videos = {}
                 for playlist in shorts_playlists:
                     playlist_id = playlist.get("playlistId", "")
                     playlist_title = playlist.get("playlistTitle", "")
 
-                    videos = fetch_playlist_videos_from_youtube(
-                        youtube, playlist_id, channel_id
-                    )
+                    videos = playlist_videos.get(playlist_id, [])
 
                     for video in videos:
-                        video_id = video.get("videoId", "")
-                        title = video.get("title", "")
-                        publish_at = video.get("publishAt", "")
-                        published_at = video.get("publishedAt", "")
-                        is_scheduled = video.get("isScheduled", False)
-                        privacy_status = video.get("privacyStatus", "public")
+                        video_id = video["videoId"]
+                        title = video["title"]
+                        publish_at = video["publishAt"]
+                        published_at = video["publishedAt"]
+                        is_scheduled = video["isScheduled"]
+                        privacy_status = video["privacyStatus"]
 
                         # Skip private videos (only show public and unlisted/scheduled)
                         if privacy_status == "private":
@@ -6347,9 +6591,7 @@ def api_calendar_data():
                             # Add YouTube video event
                             calendar_events.append(
                                 {
-                                    "date": display_date.strftime("%Y-%m-%d"),
-                                    "time": display_date.strftime("%H:%M:%S"),
-                                    "datetime": display_date.isoformat(),
+                                    **_calendar_datetime_fields(display_date),
                                     "platform": "YouTube",
                                     "video_title": title,
                                     "video_id": video_id,
@@ -6396,13 +6638,9 @@ def api_calendar_data():
 
                                             calendar_events.append(
                                                 {
-                                                    "date": schedule_date.strftime(
-                                                        "%Y-%m-%d"
-                                                    ),
-                                                    "time": schedule_date.strftime(
-                                                        "%H:%M:%S"
+                                                    **_calendar_datetime_fields(
+                                                        schedule_date
                                                     ),
-                                                    "datetime": schedule_date.isoformat(),
                                                     "platform": platform.title(),
                                                     "video_title": title,
                                                     "video_id": video_id,
@@ -6460,19 +6698,18 @@ def api_calendar_data():
                         dt = dt.astimezone(ist)
 
                     # Check if this event already exists
+                    dt_fields = _calendar_datetime_fields(dt)
                     exists = any(
                         e.get("video_id") == row_dict.get("video_id")
                         and e.get("platform") == row_dict.get("platform", "").title()
-                        and e.get("datetime") == dt.isoformat()
+                        and e.get("datetime") == dt_fields["datetime"]
                         for e in calendar_events
                     )
 
                     if not exists:
                         calendar_events.append(
                             {
-                                "date": dt.strftime("%Y-%m-%d"),
-                                "time": dt.strftime("%H:%M:%S"),
-                                "datetime": dt.isoformat(),
+                                **dt_fields,
                                 "platform": row_dict.get("platform", "").title(),
                                 "video_title": row_dict.get(
                                     "video_title", "Untitled Video"
@@ -6880,18 +7117,17 @@ def api_queue_publish_now():
                 video_id = match.group(1)
 
         now = datetime.now().isoformat()
-        published_count = 0
 
-        for platform in platforms:
-            cursor.execute(
-                """
-                INSERT INTO social_media_posts 
-                (video_id, platform, post_content, status, actual_scheduled_date, created_at, updated_at)
-                VALUES (?, ?, ?, 'published', ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-            """,
-                (video_id, platform, content, now),
-            )
-            published_count += 1
+        # Insert every platform's row with one prepared statement
+        cursor.executemany(
+            """
+            INSERT INTO social_media_posts 
+            (video_id, platform, post_content, status, actual_scheduled_date, created_at, updated_at)
+            VALUES (?, ?, ?, 'published', ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+        """,
+            [(video_id, platform, content, now) for platform in platforms],
+        )
+        published_count = len(platforms)
 
         conn.commit()
         conn.close()
@@ -7799,7 +8035,10 @@ def api_upload_video():
             )
 
             # Execute upload
+            import random
+
             response = None
+            retry = 0
             while response is None:
                 try:
                     status, response = request_obj.next_chunk()
@@ -7807,8 +8046,10 @@ def api_upload_video():
                         percent = int(status.progress() * 100)
                         print(f"Upload progress: {percent}%")
                 except HttpError as e:
-                    if e.resp.status in [500, 502, 503, 504]:
-                        # Retry on server errors
+                    if e.resp.status in [500, 502, 503, 504] and retry < 6:
+                        # Retry on server errors with jittered backoff
+                        time.sleep(min(60, random.uniform(0.5, 1.5) * (2**retry)))
+                        retry += 1
                         continue
                     else:
                         raise
@@ -8,6 +8,59 @@ from typing import Dict, List, Optional, Tuple
 from app.tagging import derive_type_enhanced, derive_role_enhanced
 
 
+# Session analysis patterns, compiled once at import instead of on every
+# findall() call over the (often long) session transcript
+_ISSUE_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'(?:struggling|struggle|having trouble|trouble with|problem with|issue with|challenge|difficulty|failing|failed|rejected|couldn\'t|can\'t|cannot) (?:with|to|in|at)?\s*([^.?!]+[.?!])',
+        r'(?:need help|need assistance|help with|looking for help|want to|trying to|attempting to)\s+([^.?!]+[.?!])',
+        r'(?:concern|worry|anxious|nervous|stressed) (?:about|with|that)\s+([^.?!]+[.?!])'
+    )
+)
+
+_GOAL_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'(?:goal|objective|want to|trying to|aiming to|planning to|hoping to|target)\s+([^.?!]+[.?!])',
+        r'(?:preparing for|preparing to|interview for|applying for|applying to)\s+([^.?!]+[.?!])'
+    )
+)
+
+_MISTAKE_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'(?:mistake|error|wrong|incorrect|misconception|didn\'t understand|didn\'t realize|shouldn\'t have|should have)\s+([^.?!]+[.?!])',
+        r'(?:was doing|were doing|was saying|were saying)\s+([^.?!]+[.?!])\s+(?:but|however|instead)',
+        r'(?:don\'t do|avoid|stop|never)\s+([^.?!]+[.?!])'
+    )
+)
+
+_SOLUTION_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'(?:solution|fix|approach|strategy|framework|method|technique|way to|how to)\s+([^.?!]+[.?!])',
+        r'(?:taught|showed|explained|helped|guided)\s+([^.?!]+[.?!])',
+        r'(?:instead|better|correct|right way|proper)\s+([^.?!]+[.?!])',
+        r'(?:key|important|critical|essential|crucial)\s+(?:point|insight|takeaway|learning|lesson)\s+([^.?!]+[.?!])'
+    )
+)
+
+_UNIQUE_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'(?:framework|strategy|approach|method|technique|principle|concept)\s+(?:that|which|to)\s+([^.?!]+[.?!])',
+        r'(?:unique|different|better|proven|effective|powerful)\s+([^.?!]+[.?!])',
+        r'(?:insight|perspective|angle|viewpoint)\s+([^.?!]+[.?!])'
+    )
+)
+
+_INSIGHT_PATTERNS = tuple(
+    re.compile(rf'{keyword}\s+([^.?!]+[.?!])', re.IGNORECASE)
+    for keyword in ['breakthrough', 'ah-ha moment', 'realized', 'understood', 'learned', 'discovered']
+)
+
+
 def analyze_session(session_content: str) -> Dict[str, any]:
     """
     Deeply analyze a coaching session to extract:
@@ -32,7 +85,6 @@ def analyze_session(session_content: str) -> Dict[str, any]:
     }
     
     content_lower = session_content.lower()
-    lines = session_content.split('\n')
     
     # Extract role and type from filename/content
     analysis['role'] = extract_role_from_content(session_content)
@@ -40,69 +92,37 @@ def analyze_session(session_content: str) -> Dict[str, any]:
     analysis['tech_stack'] = extract_tech_stack(session_content)
     
     # Extract pressing issue (look for patterns like "struggling with", "having trouble", "need help", "problem")
-    issue_patterns = [
-        r'(?:struggling|struggle|having trouble|trouble with|problem with|issue with|challenge|difficulty|failing|failed|rejected|couldn\'t|can\'t|cannot) (?:with|to|in|at)?\s*([^.?!]+[.?!])',
-        r'(?:need help|need assistance|help with|looking for help|want to|trying to|attempting to)\s+([^.?!]+[.?!])',
-        r'(?:concern|worry|anxious|nervous|stressed) (?:about|with|that)\s+([^.?!]+[.?!])'
-    ]
-    
-    for pattern in issue_patterns:
-        matches = re.findall(pattern, content_lower, re.IGNORECASE)
+    for pattern in _ISSUE_PATTERNS:
+        matches = pattern.findall(content_lower)
         if matches:
             analysis['pressing_issue'] = matches[0].strip()
             break
     
     # Extract goal/objective
-    goal_patterns = [
-        r'(?:goal|objective|want to|trying to|aiming to|planning to|hoping to|target)\s+([^.?!]+[.?!])',
-        r'(?:preparing for|preparing to|interview for|applying for|applying to)\s+([^.?!]+[.?!])'
-    ]
-    
-    for pattern in goal_patterns:
-        matches = re.findall(pattern, content_lower, re.IGNORECASE)
+    for pattern in _GOAL_PATTERNS:
+        matches = pattern.findall(content_lower)
         if matches:
             analysis['goal'] = matches[0].strip()
             break
     
     # Extract mistakes (look for patterns indicating errors, wrong approaches, misconceptions)
-    mistake_patterns = [
-        r'(?:mistake|error|wrong|incorrect|misconception|didn\'t understand|didn\'t realize|shouldn\'t have|should have)\s+([^.?!]+[.?!])',
-        r'(?:was doing|were doing|was saying|were saying)\s+([^.?!]+[.?!])\s+(?:but|however|instead)',
-        r'(?:don\'t do|avoid|stop|never)\s+([^.?!]+[.?!])'
-    ]
-    
-    for pattern in mistake_patterns:
-        matches = re.findall(pattern, content_lower, re.IGNORECASE)
+    for pattern in _MISTAKE_PATTERNS:
+        matches = pattern.findall(content_lower)
         analysis['mistakes'].extend([m.strip() for m in matches[:3]])  # Top 3 mistakes
     
     # Extract solutions and unique teachings
-    solution_patterns = [
-        r'(?:solution|fix|approach|strategy|framework|method|technique|way to|how to)\s+([^.?!]+[.?!])',
-        r'(?:taught|showed|explained|helped|guided)\s+([^.?!]+[.?!])',
-        r'(?:instead|better|correct|right way|proper)\s+([^.?!]+[.?!])',
-        r'(?:key|important|critical|essential|crucial)\s+(?:point|insight|takeaway|learning|lesson)\s+([^.?!]+[.?!])'
-    ]
-    
-    for pattern in solution_patterns:
-        matches = re.findall(pattern, content_lower, re.IGNORECASE)
+    for pattern in _SOLUTION_PATTERNS:
+        matches = pattern.findall(content_lower)
         analysis['solutions'].extend([m.strip() for m in matches[:5]])  # Top 5 solutions
     
     # Extract unique teachings (frameworks, strategies, unique insights)
-    unique_patterns = [
-        r'(?:framework|strategy|approach|method|technique|principle|concept)\s+(?:that|which|to)\s+([^.?!]+[.?!])',
-        r'(?:unique|different|better|proven|effective|powerful)\s+([^.?!]+[.?!])',
-        r'(?:insight|perspective|angle|viewpoint)\s+([^.?!]+[.?!])'
-    ]
-    
-    for pattern in unique_patterns:
-        matches = re.findall(pattern, content_lower, re.IGNORECASE)
+    for pattern in _UNIQUE_PATTERNS:
+        matches = pattern.findall(content_lower)
         analysis['unique_teachings'].extend([m.strip() for m in matches[:3]])
     
     # Extract key insights for marketing
-    insight_keywords = ['breakthrough', 'ah-ha moment', 'realized', 'understood', 'learned', 'discovered']
-    for keyword in insight_keywords:
-        pattern = rf'{keyword}\s+([^.?!]+[.?!])'
-        matches = re.findall(pattern, content_lower, re.IGNORECASE)
+    for pattern in _INSIGHT_PATTERNS:
+        matches = pattern.findall(content_lower)
         analysis['key_insights'].extend([m.strip() for m in matches[:3]])
     
     # Extract context (interview type, company, role level)
@@ -3,7 +3,7 @@ Tagging and categorization utilities for videos and playlists.
 """
 
 import re
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 
 # Role definitions (including student/entry-level roles)
@@ -71,12 +71,110 @@ COMMON_TAGS = [
 ]
 
 
+# Type keywords (interview types first as they're more specific)
+_TYPE_KEYWORDS = {
+    'sys_design_interview': [
+        'system design interview', 'sys design interview', 'system design round',
+        'design interview', 'architecture interview'
+    ],
+    'coding_interview': [
+        'coding interview', 'programming interview', 'technical coding',
+        'code interview', 'coding round'
+    ],
+    'leetcode': [
+        'leetcode', 'leet code', 'leetcode problem', 'leetcode solution'
+    ],
+    'algorithm_interview': [
+        'algorithm interview', 'algorithms interview', 'dsa interview',
+        'data structure interview', 'algo interview'
+    ],
+    'behavioral_interview': [
+        'behavioral interview', 'behavior interview', 'cultural fit',
+        'soft skills interview', 'hr interview'
+    ],
+    'mock_interview': [
+        'mock interview', 'practice interview', 'simulated interview'
+    ],
+    
+    # General types
+    'sys_design': [
+        'system design', 'sys design', 'system architecture', 'architecture',
+        'design pattern', 'scalability', 'distributed system', 'microservices',
+        'database design', 'api design', 'infrastructure', 'system scaling'
+    ],
+    'interview': [
+        'interview', 'interview prep', 'interview question',
+        'interview tips', 'interview guide', 'interview practice'
+    ],
+    'resume': [
+        'resume', 'cv', 'resume tips', 'resume review', 'resume writing'
+    ],
+    'job_search': [
+        'job search', 'finding job', 'job hunting', 'job application',
+        'applying jobs', 'job interview'
+    ],
+    'leadership': [
+        'leadership', 'management', 'team', 'people', 'career',
+        'mentor', 'coaching', 'strategy', 'executive', 'decision'
+    ],
+    'career': [
+        'career', 'career growth', 'career advice', 'career development',
+        'promotion', 'salary', 'negotiation'
+    ],
+    'technical': [
+        'coding', 'programming', 'algorithm', 'data structure', 'technical',
+        'implementation', 'code review', 'best practices'
+    ],
+    'product': [
+        'product management', 'product strategy', 'product roadmap',
+        'feature', 'product launch', 'product metrics'
+    ]
+}
+
+
+def _build_type_keyword_index():
+    """
+    Compile all type keywords into one lookahead alternation.
+
+    The lookahead reports the longest keyword starting at each position; every
+    keyword that is a prefix of it also occurs there, so each match credits
+    those keywords' types too. This gives the same counts as calling
+    text.count() per keyword while scanning the text only once.
+    """
+    keywords = sorted(
+        {kw for kws in _TYPE_KEYWORDS.values() for kw in kws}, key=len, reverse=True
+    )
+    pattern = re.compile('(?=(' + '|'.join(re.escape(kw) for kw in keywords) + '))')
+    credits = {
+        kw: [
+            type_key
+            for type_key, kws in _TYPE_KEYWORDS.items()
+            for other in kws
+            if kw.startswith(other)
+        ]
+        for kw in keywords
+    }
+    return pattern, credits
+
+
+_TYPE_KEYWORD_RE, _TYPE_KEYWORD_CREDITS = _build_type_keyword_index()
+
+
+def _context_text(playlist_title: str, video_title: str, video_description: str, video_tags: str) -> str:
+    """Build the lowercased text that role/type derivation matches against."""
+    return f"{playlist_title} {video_title} {video_description} {video_tags}".lower()
+
+
 def derive_role_enhanced(playlist_title: str, video_title: str, video_description: str, video_tags: str) -> str:
     """
     Enhanced role derivation supporting more roles: SPO, SPM, VP, DIR, MGR, SA, SWE, EM, etc.
     """
-    text = f"{playlist_title} {video_title} {video_description} {video_tags}".lower()
-    
+    text = _context_text(playlist_title, video_title, video_description, video_tags)
+    return _derive_role_from_text(text)
+
+
+def _derive_role_from_text(text: str) -> str:
+    """Derive role from already lowercased context text."""
     # Check for role keywords (order matters - more specific first)
     role_patterns = {
         # Student/Entry-level (check first as they're more specific)
@@ -114,80 +212,32 @@ def derive_type_enhanced(playlist_title: str, video_title: str, video_descriptio
     """
     Enhanced type derivation supporting more types.
     """
-    text = f"{playlist_title} {video_title} {video_description} {video_tags}".lower()
-    
-    type_patterns = {
-        # Interview types (check first as they're more specific)
-        'sys_design_interview': [
-            'system design interview', 'sys design interview', 'system design round',
-            'design interview', 'architecture interview'
-        ],
-        'coding_interview': [
-            'coding interview', 'programming interview', 'technical coding',
-            'code interview', 'coding round'
-        ],
-        'leetcode': [
-            'leetcode', 'leet code', 'leetcode problem', 'leetcode solution'
-        ],
-        'algorithm_interview': [
-            'algorithm interview', 'algorithms interview', 'dsa interview',
-            'data structure interview', 'algo interview'
-        ],
-        'behavioral_interview': [
-            'behavioral interview', 'behavior interview', 'cultural fit',
-            'soft skills interview', 'hr interview'
-        ],
-        'mock_interview': [
-            'mock interview', 'practice interview', 'simulated interview'
-        ],
-        
-        # General types
-        'sys_design': [
-            'system design', 'sys design', 'system architecture', 'architecture',
-            'design pattern', 'scalability', 'distributed system', 'microservices',
-            'database design', 'api design', 'infrastructure', 'system scaling'
-        ],
-        'interview': [
-            'interview', 'interview prep', 'interview question',
-            'interview tips', 'interview guide', 'interview practice'
-        ],
-        'resume': [
-            'resume', 'cv', 'resume tips', 'resume review', 'resume writing'
-        ],
-        'job_search': [
-            'job search', 'finding job', 'job hunting', 'job application',
-            'applying jobs', 'job interview'
-        ],
-        'leadership': [
-            'leadership', 'management', 'team', 'people', 'career',
-            'mentor', 'coaching', 'strategy', 'executive', 'decision'
-        ],
-        'career': [
-            'career', 'career growth', 'career advice', 'career development',
-            'promotion', 'salary', 'negotiation'
-        ],
-        'technical': [
-            'coding', 'programming', 'algorithm', 'data structure', 'technical',
-            'implementation', 'code review', 'best practices'
-        ],
-        'product': [
-            'product management', 'product strategy', 'product roadmap',
-            'feature', 'product launch', 'product metrics'
-        ]
-    }
-    
-    type_scores = {}
-    for type_key, keywords in type_patterns.items():
-        score = sum(text.count(kw) for kw in keywords)
-        if score > 0:
-            type_scores[type_key] = score
+    text = _context_text(playlist_title, video_title, video_description, video_tags)
+    return _derive_type_from_text(text)
+
+
+def _derive_type_from_text(text: str) -> str:
+    """Derive type from already lowercased context text."""
+    type_scores = dict.fromkeys(_TYPE_KEYWORDS, 0)
+    for match in _TYPE_KEYWORD_RE.finditer(text):
+        for type_key in _TYPE_KEYWORD_CREDITS[match.group(1)]:
+            type_scores[type_key] += 1
     
+    type_scores = {type_key: score for type_key, score in type_scores.items() if score > 0}
     if type_scores:
         return max(type_scores, key=type_scores.get)
     
     return ""
 
 
+def derive_type_and_role(playlist_title: str, video_title: str, video_description: str, video_tags: str) -> Tuple[str, str]:
+    """
+    Derive (type, role) together, building and lowercasing the context text once.
+    """
+    text = _context_text(playlist_title, video_title, video_description, video_tags)
+    return _derive_type_from_text(text), _derive_role_from_text(text)
+
+
 def suggest_tags(video_title: str, video_description: str, video_type: str, role: str) -> List[str]:
     """
     Suggest tags based on video content, type, and role.
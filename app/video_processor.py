@@ -3,6 +3,7 @@ Video processing module for downloading YouTube videos and uploading to social m
 This enables native video uploads for maximum engagement.
 """
 
+import functools
 import os
 import yt_dlp
 import requests
@@ -12,6 +13,12 @@ from typing import Optional, Dict, Any
 import time
 
 
+@functools.lru_cache(maxsize=1)
+def _http_session() -> requests.Session:
+    """Shared session so uploads to the same API host reuse connections."""
+    return requests.Session()
+
+
 class VideoDownloader:
     """Downloads videos from YouTube for native upload to social platforms."""
     
@@ -94,6 +101,20 @@ class LinkedInVideoUploader:
         self.access_token = access_token
         self.person_urn = person_urn
         self.api_base = "https://api.linkedin.com/v2"
+        
+        # Request pieces that only depend on the account, built once per uploader
+        self._auth_headers = {"Authorization": f"Bearer {access_token}"}
+        self._json_headers = {**self._auth_headers, "Content-Type": "application/json"}
+        self._register_data = {
+            "registerUploadRequest": {
+                "recipes": ["urn:li:digitalmediaRecipe:feedshare-video"],
+                "owner": person_urn,
+                "serviceRelationships": [{
+                    "relationshipType": "OWNER",
+                    "identifier": "urn:li:userGeneratedContent"
+                }]
+            }
+        }
     
     def upload_video(self, video_path: str, caption: str, title: str = None) -> Dict[str, Any]:
         """
@@ -105,27 +126,11 @@ class LinkedInVideoUploader:
         3. Create post with video URN
         """
         try:
-            headers = {
-                "Authorization": f"Bearer {self.access_token}",
-                "Content-Type": "application/json"
-            }
-            
             # Step 1: Register upload
-            register_data = {
-                "registerUploadRequest": {
-                    "recipes": ["urn:li:digitalmediaRecipe:feedshare-video"],
-                    "owner": self.person_urn,
-                    "serviceRelationships": [{
-                        "relationshipType": "OWNER",
-                        "identifier": "urn:li:userGeneratedContent"
-                    }]
-                }
-            }
-            
-            response = requests.post(
+            response = _http_session().post(
                 f"{self.api_base}/assets?action=registerUpload",
-                headers=headers,
-                json=register_data
+                headers=self._json_headers,
+                json=self._register_data
             )
             
             if response.status_code != 200:
@@ -137,10 +142,7 @@ class LinkedInVideoUploader:
             
             # Step 2: Upload video file
             with open(video_path, 'rb') as video_file:
-                upload_headers = {
-                    "Authorization": f"Bearer {self.access_token}",
-                }
-                upload_response = requests.put(upload_url, headers=upload_headers, data=video_file)
+                upload_response = _http_session().put(upload_url, headers=self._auth_headers, data=video_file)
                 
                 if upload_response.status_code not in [200, 201]:
                     return {'success': False, 'error': f"Upload failed: {upload_response.text}"}
@@ -169,9 +171,9 @@ class LinkedInVideoUploader:
                 }
             }
             
-            post_response = requests.post(
+            post_response = _http_session().post(
                 f"{self.api_base}/ugcPosts",
-                headers=headers,
+                headers=self._json_headers,
                 json=post_data
             )
             
@@ -215,7 +217,7 @@ class FacebookVideoUploader:
                         'access_token': self.page_access_token
                     }
                     
-                    response = requests.post(
+                    response = _http_session().post(
                         f"{self.api_base}/{self.page_id}/videos",
                         files=files,
                         data=data
@@ -281,7 +283,7 @@ class InstagramVideoUploader:
                 }
                 
                 # Create container with direct file upload
-                response = requests.post(
+                response = _http_session().post(
                     f"{self.api_base}/{self.business_account_id}/media",
                     files=files,
                     data=data
@@ -310,7 +312,7 @@ class InstagramVideoUploader:
                 time.sleep(5)
                 wait_time += 5
                 
-                status_response = requests.get(
+                status_response = _http_session().get(
                     f"{self.api_base}/{creation_id}",
                     params={'fields': 'status_code', 'access_token': self.access_token}
                 )
@@ -327,7 +329,7 @@ class InstagramVideoUploader:
                 'access_token': self.access_token
             }
             
-            publish_response = requests.post(
+            publish_response = _http_session().post(
                 f"{self.api_base}/{self.business_account_id}/media_publish",
                 data=publish_data
             )
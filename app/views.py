@@ -34,7 +34,15 @@ def get_youtube_service():
             with open(TOKEN_FILE, "w", encoding="utf-8") as f:
                 f.write(creds.to_json())
         
-        return build("youtube", "v3", credentials=creds)
+        # One AuthorizedHttp keeps the HTTPS connection alive across all
+        # calls made with this service instead of reconnecting per request
+        import google_auth_httplib2
+        import httplib2
+
+        authed_http = google_auth_httplib2.AuthorizedHttp(
+            creds, http=httplib2.Http(timeout=30)
+        )
+        return build("youtube", "v3", http=authed_http, cache_discovery=False)
     except Exception as e:
         print(f"Error getting YouTube service: {e}")
         return None
@@ -39,10 +39,24 @@ if __name__ == "__main__":
         or os.getenv("FLASK_DEBUG", "False").lower() == "true"
     )
 
-    app.run(
-        host="0.0.0.0",
-        port=port,
-        debug=debug,
-        ssl_context=ssl_context,
-        threaded=True,  # Enable threading for better performance
-    )
+    try:
+        from waitress import serve
+    except ImportError:
+        serve = None
+
+    # Serve production traffic with waitress: a multi-threaded WSGI server
+    # with keep-alive. It runs in this single process, so the in-process
+    # APScheduler jobs and caches aren't duplicated the way they would be
+    # across forked workers. The Werkzeug dev server is kept for debugging
+    # and for local HTTPS, which waitress doesn't terminate.
+    if serve and not debug and not ssl_context:
+        print(f"🚀 Serving with waitress on port {port}")
+        serve(app, host="0.0.0.0", port=port, threads=16)
+    else:
+        app.run(
+            host="0.0.0.0",
+            port=port,
+            debug=debug,
+            ssl_context=ssl_context,
+            threaded=True,  # Enable threading for better performance
+        )
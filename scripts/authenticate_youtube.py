@@ -76,10 +76,15 @@ def authenticate_youtube():
                 print(f"❌ Authentication failed: {e}")
                 return False
 
-        # Save credentials
+        # Save credentials atomically so a crash mid-write can't leave a
+        # truncated token that forces a full browser re-auth next run
         try:
-            with open(TOKEN_FILE, "w", encoding="utf-8") as f:
+            tmp_file = TOKEN_FILE + ".tmp"
+            with open(tmp_file, "w", encoding="utf-8") as f:
                 f.write(creds.to_json())
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, TOKEN_FILE)
             print(f"✅ Saved credentials to {TOKEN_FILE}")
         except Exception as e:
             print(f"❌ Failed to save token: {e}")
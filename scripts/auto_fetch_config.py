@@ -7,14 +7,28 @@ This tries multiple methods to get all configuration data.
 import sys
 import os
 import json
+import time
 import requests
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.database import load_settings_from_db, save_settings_to_db
 
+# The Instagram account behind a Page rarely changes, so re-query it at most daily
+IG_ACCOUNT_CACHE_TTL = 24 * 60 * 60
+
+# Shared session so Graph API calls reuse one keep-alive connection
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+))
+
 def try_get_instagram_account_id(page_id, page_token):
     """Try to get Instagram Business Account ID using Page Access Token."""
     print(f"🔍 Trying to fetch Instagram Account ID for Page: {page_id}")
@@ -26,7 +40,7 @@ def try_get_instagram_account_id(page_id, page_token):
     }
     
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = SESSION.get(url, params=params, timeout=10)
         
         if response.status_code == 200:
             data = response.json()
@@ -61,7 +75,7 @@ def try_get_instagram_account_id(page_id, page_token):
         print(f"❌ Network error: {e}")
         return None, None
 
-def auto_fetch_config():
+def auto_fetch_config(force=False):
     """Automatically fetch config using available methods."""
     print("=" * 70)
     print("🔍 Auto-Fetch Facebook/Instagram Configuration")
@@ -98,6 +112,17 @@ def auto_fetch_config():
     print(f"🔑 Page Token: {page_token[:30]}...")
     print()
     
+    # Skip the Graph API call if the account ID was fetched recently
+    # The fetch time lives outside api_keys, where the app counts every
+    # truthy value as a configured key
+    cache = settings.get('cache', {})
+    cached_ig_account_id = api_keys.get('instagram_business_account_id')
+    fetched_at = cache.get('instagram_business_account_id_fetched_at', 0)
+    if not force and cached_ig_account_id and time.time() - fetched_at < IG_ACCOUNT_CACHE_TTL:
+        print(f"✅ Instagram Business Account ID fetched recently: {cached_ig_account_id}")
+        print("   Run with --force to fetch it again.")
+        return True
+    
     # Try to get Instagram Account ID
     ig_account_id, ig_username = try_get_instagram_account_id(page_id, page_token)
     
@@ -105,27 +130,33 @@ def auto_fetch_config():
     updated = False
     if ig_account_id:
         api_keys['instagram_business_account_id'] = ig_account_id
+        cache['instagram_business_account_id_fetched_at'] = time.time()
         updated = True
     
     if updated:
+        # Drop the timestamp earlier versions stored among the API keys
+        api_keys.pop('instagram_business_account_id_fetched_at', None)
         settings['api_keys'] = api_keys
+        settings['cache'] = cache
         save_settings_to_db(settings)
         
         # Also update MY_CONFIG.json
         config_file = Path('MY_CONFIG.json')
         if config_file.exists():
             try:
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
-                
-                if ig_account_id:
-                    config['api_keys']['instagram_business_account_id'] = ig_account_id
-                
-                with open(config_file, 'w') as f:
-                    json.dump(config, f, indent=2)
+                config = json.loads(config_file.read_text())
+                config_keys = config.setdefault('api_keys', {})
                 
-                print()
-                print("✅ Updated MY_CONFIG.json!")
+                # Only rewrite the file when the ID actually changed, and swap
+                # it in atomically so readers never see a half-written file
+                if config_keys.get('instagram_business_account_id') != ig_account_id:
+                    config_keys['instagram_business_account_id'] = ig_account_id
+                    tmp_file = config_file.with_suffix('.json.tmp')
+                    tmp_file.write_text(json.dumps(config, indent=2))
+                    os.replace(tmp_file, config_file)
+                    
+                    print()
+                    print("✅ Updated MY_CONFIG.json!")
             except Exception as e:
                 print(f"⚠️  Could not update MY_CONFIG.json: {e}")
         
@@ -160,7 +191,7 @@ def auto_fetch_config():
 
 if __name__ == '__main__':
     try:
-        success = auto_fetch_config()
+        success = auto_fetch_config(force='--force' in sys.argv)
         sys.exit(0 if success else 1)
     except KeyboardInterrupt:
         print("\n\n❌ Cancelled by user.")
@@ -6,6 +6,18 @@ import os
 from pathlib import Path
 
 DOWNLOAD_DIR = "data/shorts_downloads"
+VIDEO_EXTENSIONS = (".mp4", ".webm")
+
+
+def count_videos(playlist_dir):
+    """Count video files in a playlist folder with a single directory scan."""
+    with os.scandir(playlist_dir) as entries:
+        return sum(
+            1
+            for entry in entries
+            if entry.name.endswith(VIDEO_EXTENSIONS)
+            and entry.is_file(follow_symlinks=False)
+        )
 
 
 def main():
@@ -21,7 +33,10 @@ def main():
         return
 
     # Get all playlist folders
-    playlists = sorted([d for d in base_dir.iterdir() if d.is_dir()])
+    with os.scandir(base_dir) as entries:
+        playlists = sorted(
+            (entry for entry in entries if entry.is_dir()), key=lambda e: e.name
+        )
 
     total_playlists = len(playlists)
     total_videos = 0
@@ -30,12 +45,11 @@ def main():
 
     print(f"📂 Found {total_playlists} playlist folders\n")
 
+    # Collect the per-playlist lines and write them in one go
+    report_lines = []
     for playlist_dir in playlists:
         # Count video files
-        video_files = list(playlist_dir.glob("*.mp4")) + list(
-            playlist_dir.glob("*.webm")
-        )
-        video_count = len(video_files)
+        video_count = count_videos(playlist_dir)
         total_videos += video_count
 
         if video_count == 0:
@@ -45,7 +59,10 @@ def main():
             successful_playlists.append((playlist_dir.name, video_count))
             status = f"✅ {video_count:2d} videos"
 
-        print(f"{status} - {playlist_dir.name}")
+        report_lines.append(f"{status} - {playlist_dir.name}")
+
+    if report_lines:
+        print("\n".join(report_lines))
 
     print()
     print("=" * 80)
@@ -58,8 +75,7 @@ def main():
 
     if empty_playlists:
         print("Empty playlists (may contain private/unlisted videos):")
-        for name in empty_playlists:
-            print(f"   • {name}")
+        print("\n".join(f"   • {name}" for name in empty_playlists))
         print()
         print(
             "Note: These playlists likely contain private, unlisted, or deleted videos"
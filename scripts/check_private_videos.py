@@ -3,19 +3,29 @@ Check which videos in failed playlists are private vs accessible.
 This helps identify which videos need privacy settings changed.
 """
 
+import json
 import os
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from googleapiclient.discovery import build
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
-import subprocess
+from googleapiclient.errors import HttpError
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 TOKEN_FILE = "token.json"
 SCOPES = ["https://www.googleapis.com/auth/youtube.readonly"]
 
+# Playlist contents cached between runs, revalidated with the first page's ETag
+PLAYLIST_CACHE_FILE = "playlist_cache.json"
+# The first page's ETag can't see edits further down a long playlist, so
+# entries older than this are always refetched in full
+PLAYLIST_CACHE_TTL = 24 * 60 * 60
+
 # Playlists that failed to download
 FAILED_PLAYLISTS = {
     "PLZed_adPqIJoBFiaJFoxF6yJ9Ly_rsK0J": "Why Directors Fail: The FAANG Bar-Raiser Secrets – Shorts",
@@ -26,8 +36,8 @@ FAILED_PLAYLISTS = {
 }
 
 
-def get_youtube_service():
-    """Get authenticated YouTube API service."""
+def get_youtube_credentials():
+    """Load (and if needed refresh) the saved YouTube credentials."""
     creds = None
     if os.path.exists(TOKEN_FILE):
         creds = Credentials.from_authorized_user_file(TOKEN_FILE, SCOPES)
@@ -39,13 +49,40 @@ def get_youtube_service():
             print("❌ No valid YouTube credentials found.")
             return None
 
-    return build("youtube", "v3", credentials=creds)
+    return creds
+
+
+def load_playlist_cache():
+    """Load cached playlist contents, or an empty cache if there is none."""
+    try:
+        with open(PLAYLIST_CACHE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_playlist_cache(cache):
+    """Write cached playlist contents for the next run."""
+    tmp_file = PLAYLIST_CACHE_FILE + ".tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(cache, f)
+    os.replace(tmp_file, PLAYLIST_CACHE_FILE)
+
+
+def get_playlist_videos(youtube, playlist_id, cache=None):
+    """
+    Get all videos from a playlist.
 
+    With a cache, a recent entry is revalidated by sending its ETag on the
+    first page request; a 304 returns the cached videos without paging.
+    """
+    cached = cache.get(playlist_id) if cache is not None else None
+    if cached and time.time() - cached["fetched_at"] > PLAYLIST_CACHE_TTL:
+        cached = None
 
-def get_playlist_videos(youtube, playlist_id):
-    """Get all videos from a playlist."""
     videos = []
     next_page_token = None
+    first_page_etag = None
 
     while True:
         request = youtube.playlistItems().list(
@@ -53,48 +90,96 @@ def get_playlist_videos(youtube, playlist_id):
             playlistId=playlist_id,
             maxResults=50,
             pageToken=next_page_token,
+            fields="etag,nextPageToken,items(contentDetails/videoId,snippet/title)",
+        )
+        is_first_page = next_page_token is None
+        if cached and is_first_page:
+            request.headers["If-None-Match"] = cached["etag"]
+        try:
+            response = request.execute()
+        except HttpError as e:
+            if cached and e.resp.status == 304:
+                return cached["videos"]
+            raise
+
+        if is_first_page:
+            first_page_etag = response.get("etag")
+
+        videos.extend(
+            {
+                "id": item["contentDetails"]["videoId"],
+                "title": item["snippet"]["title"],
+            }
+            for item in response.get("items", [])
         )
-        response = request.execute()
-
-        for item in response.get("items", []):
-            video_id = item["contentDetails"]["videoId"]
-            video_title = item["snippet"]["title"]
-            videos.append({"id": video_id, "title": video_title})
 
         next_page_token = response.get("nextPageToken")
         if not next_page_token:
             break
 
+    if cache is not None and first_page_etag:
+        cache[playlist_id] = {
+            "etag": first_page_etag,
+            "fetched_at": time.time(),
+            "videos": videos,
+        }
+
     return videos
 
 
-def check_video_accessibility(video_id):
-    """Check if a video can be accessed with cookies."""
-    try:
-        cmd = [
-            "yt-dlp",
-            "--cookies-from-browser",
-            "chrome",
-            "--skip-download",
-            "--quiet",
-            "--print",
-            "%(title)s",
-            f"https://www.youtube.com/watch?v={video_id}",
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-
-        if result.returncode == 0:
-            return "accessible"
-        elif "private" in result.stderr.lower():
-            return "private"
-        elif "unavailable" in result.stderr.lower():
-            return "unavailable"
-        else:
-            return "unknown"
-    except subprocess.TimeoutExpired:
-        return "timeout"
-    except Exception:
-        return "error"
+def get_video_privacy_statuses(youtube, video_ids):
+    """
+    Get the privacy status of each video, 50 IDs per videos.list call.
+
+    Videos the API doesn't return (deleted or otherwise unavailable) are
+    reported as "unavailable".
+    """
+    statuses = {video_id: "unavailable" for video_id in video_ids}
+
+    for i in range(0, len(video_ids), 50):
+        batch_ids = video_ids[i : i + 50]
+        response = (
+            youtube.videos()
+            .list(
+                part="status",
+                id=",".join(batch_ids),
+                maxResults=50,
+                fields="items(id,status/privacyStatus)",
+            )
+            .execute()
+        )
+        for item in response.get("items", []):
+            statuses[item["id"]] = item["status"]["privacyStatus"]
+
+    return statuses
+
+
+def check_playlists(creds, playlist_ids, cache=None, max_workers=8):
+    """
+    List each playlist's videos and their privacy statuses concurrently.
+
+    Each worker builds its own YouTube client from the shared credentials
+    because httplib2 connections are not thread-safe. Returns (videos,
+    statuses, error) per playlist, in the order given.
+    """
+    worker_state = threading.local()
+
+    def check_one(playlist_id):
+        try:
+            if not hasattr(worker_state, "youtube"):
+                worker_state.youtube = build("youtube", "v3", credentials=creds)
+            videos = get_playlist_videos(worker_state.youtube, playlist_id, cache)
+            statuses = get_video_privacy_statuses(
+                worker_state.youtube, [video["id"] for video in videos]
+            )
+            return videos, statuses, None
+        except Exception as e:
+            return [], {}, e
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(playlist_ids)))
+    ) as executor:
+        return list(executor.map(check_one, playlist_ids))
 
 
 def main():
@@ -103,16 +188,30 @@ def main():
     print("=" * 80)
     print()
 
-    youtube = get_youtube_service()
-    if not youtube:
+    # Load the credentials once; the playlist workers each build their own
+    # client around them instead of re-reading and refreshing token.json
+    creds = get_youtube_credentials()
+    if not creds:
         return
 
-    for playlist_id, playlist_title in FAILED_PLAYLISTS.items():
+    # Playlists are independent, so fetch them all up front in parallel
+    playlist_cache = load_playlist_cache()
+    results = check_playlists(creds, list(FAILED_PLAYLISTS), playlist_cache)
+    try:
+        save_playlist_cache(playlist_cache)
+    except OSError as e:
+        print(f"⚠️  Could not save playlist cache: {e}")
+
+    for (playlist_id, playlist_title), (videos, statuses, error) in zip(
+        FAILED_PLAYLISTS.items(), results
+    ):
         print(f"\n📋 {playlist_title}")
         print(f"   Playlist ID: {playlist_id}")
 
         try:
-            videos = get_playlist_videos(youtube, playlist_id)
+            if error:
+                raise error
+
             print(f"   Found {len(videos)} videos")
 
             accessible = 0
@@ -120,9 +219,9 @@ def main():
             other = 0
 
             for i, video in enumerate(videos, 1):
-                status = check_video_accessibility(video["id"])
+                status = statuses[video["id"]]
 
-                if status == "accessible":
+                if status in ("public", "unlisted"):
                     accessible += 1
                     symbol = "✅"
                 elif status == "private":
@@ -1,7 +1,10 @@
+import functools
 import os
 import re
 import wave
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 ELEVENLABS_API_KEY = os.getenv(
@@ -16,7 +19,23 @@ OUTPUT_FORMAT = os.getenv(
     "ELEVENLABS_OUTPUT_FORMAT", "pcm_22050"
 )  # pcm_16000 / pcm_22050 / pcm_24000 / pcm_44100
 
+_OUTPUT_FORMAT_RE = re.compile(r"^(?:mp3|pcm|ulaw)_(\d+)")
+
+# Shared session so repeated TTS calls reuse the TLS connection to ElevenLabs
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]
+        ),
+    ),
+)
+
 
+@functools.lru_cache(maxsize=8)
 def _sample_rate_from_output_format(output_format: str) -> int:
     """
     ElevenLabs output_format examples:
@@ -24,7 +43,7 @@ def _sample_rate_from_output_format(output_format: str) -> int:
       - pcm_22050
       - pcm_44100 (may require higher tier)
     """
-    m = re.match(r"^(?:mp3|pcm|ulaw)_(\d+)", output_format)
+    m = _OUTPUT_FORMAT_RE.match(output_format)
     if not m:
         raise ValueError(f"Unrecognized output_format: {output_format}")
     return int(m.group(1))
@@ -66,7 +85,7 @@ def paragraph_to_wav(paragraph: str, out_wav_path: str) -> str:
     }
 
     # Stream the audio bytes
-    with requests.post(
+    with SESSION.post(
         url, params=params, headers=headers, json=payload, stream=True, timeout=120
     ) as r:
         r.raise_for_status()
@@ -81,9 +100,16 @@ def paragraph_to_wav(paragraph: str, out_wav_path: str) -> str:
             wf.setsampwidth(sampwidth)
             wf.setframerate(sample_rate)
 
-            for chunk in r.iter_content(chunk_size=64 * 1024):
-                if chunk:
-                    wf.writeframes(chunk)
+            # Read large blocks straight from urllib3 rather than through
+            # iter_content's generator; decode_content keeps gzip handled.
+            # writeframesraw skips the per-call header patch that writeframes
+            # does; closing the file patches the header once at the end
+            r.raw.decode_content = True
+            while True:
+                chunk = r.raw.read(1 << 20)
+                if not chunk:
+                    break
+                wf.writeframesraw(chunk)
 
     return out_wav_path
 
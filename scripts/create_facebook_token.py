@@ -7,6 +7,10 @@ Checks if token exists and is valid, creates new one if needed.
 import sys
 import os
 import json
+import contextlib
+import threading
+import time
+import hashlib
 import webbrowser
 import http.server
 import socketserver
@@ -14,14 +18,31 @@ import urllib.parse
 from urllib.parse import urlparse, parse_qs
 import requests
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.database import load_settings_from_db, save_settings_to_db
 
+# Shared session so every Graph API call reuses one warm TLS connection
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+))
+
+# (connect, read) timeouts: fail fast on a stuck TLS handshake without
+# cutting off a slow but progressing response
+GRAPH_TIMEOUT = (3.05, 7)
+
 # Configuration
 REDIRECT_URI = "http://localhost:8080/callback"
+# Tokens verified valid within this window are not re-checked against the API
+TOKEN_CACHE_FILE = Path('.fb_token_cache.json')
+TOKEN_CACHE_TTL = 300
 SCOPES = [
     'pages_manage_posts',
     'pages_read_engagement',
@@ -43,6 +64,7 @@ class OAuthCallbackHandler(http.server.SimpleHTTPRequestHandler):
             if 'code' in params:
                 code = params['code'][0]
                 self.server.auth_code = code
+                self.server.callback_received.set()
                 self.send_response(200)
                 self.send_header('Content-type', 'text/html; charset=utf-8')
                 self.end_headers()
@@ -60,6 +82,7 @@ class OAuthCallbackHandler(http.server.SimpleHTTPRequestHandler):
             else:
                 error = params.get('error', ['Unknown error'])[0]
                 self.server.auth_error = error
+                self.server.callback_received.set()
                 self.send_response(200)
                 self.send_header('Content-type', 'text/html; charset=utf-8')
                 self.end_headers()
@@ -83,27 +106,98 @@ class OAuthCallbackHandler(http.server.SimpleHTTPRequestHandler):
         pass
 
 
+def _batch_error_message(sub_response):
+    """Get the error message from one sub-response of a Graph API batch call."""
+    try:
+        body = json.loads((sub_response or {}).get('body') or '{}')
+    except ValueError:
+        body = {}
+    return body.get('error', {}).get('message', 'Unknown error')
+
+
+def _token_cache_key(token, page_id):
+    """Cache key for a token/page pair that doesn't store the token itself."""
+    return hashlib.sha256(f"{token}:{page_id or ''}".encode()).hexdigest()[:16]
+
+
+def _read_token_cache():
+    """Load recent token check results, or an empty cache if there are none."""
+    try:
+        return json.loads(TOKEN_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_token_cache(cache):
+    """Atomically save token check results."""
+    tmp_file = TOKEN_CACHE_FILE.with_suffix('.json.tmp')
+    tmp_file.write_text(json.dumps(cache))
+    os.replace(tmp_file, TOKEN_CACHE_FILE)
+
+
 def check_token_validity(token, page_id=None):
-    """Check if a Facebook token is valid."""
+    """Check if a Facebook token is valid, reusing a recent successful check."""
     if not token:
         return False, "Token is empty"
     
+    use_cache = os.getenv('FB_TOKEN_NO_CACHE') != '1'
+    cache_key = _token_cache_key(token, page_id)
+    if use_cache:
+        cached = _read_token_cache().get(cache_key)
+        if cached and time.time() - cached['checked_at'] < TOKEN_CACHE_TTL:
+            return True, f"{cached['message']} (checked recently)"
+    
+    is_valid, message = _check_token_validity_live(token, page_id)
+    
+    # Only successful checks are cached so a fixed token is re-checked at once
+    if is_valid and use_cache:
+        try:
+            cache = _read_token_cache()
+            now = time.time()
+            cache = {k: v for k, v in cache.items() if now - v['checked_at'] < TOKEN_CACHE_TTL}
+            cache[cache_key] = {'checked_at': now, 'message': message}
+            _write_token_cache(cache)
+        except OSError:
+            pass
+    
+    return is_valid, message
+
+
+def _check_token_validity_live(token, page_id=None):
+    """Check a Facebook token (and page access, if given) against the Graph API."""
     try:
+        if page_id:
+            # Check the token and access to the page in one batch round trip
+            batch = [
+                {'method': 'GET', 'relative_url': 'me'},
+                {'method': 'GET', 'relative_url': f'{page_id}?fields=id,name'},
+            ]
+            response = _SESSION.post(
+                "https://graph.facebook.com/v18.0/",
+                data={'access_token': token, 'batch': json.dumps(batch)},
+                timeout=GRAPH_TIMEOUT
+            )
+            data = response.json() if response.content else {}
+            
+            # An unusable token fails the whole batch rather than a sub-request
+            if response.status_code != 200 or not isinstance(data, list):
+                error_data = data if isinstance(data, dict) else {}
+                error_msg = error_data.get('error', {}).get('message', 'Unknown error')
+                return False, f"Token invalid: {error_msg}"
+            
+            me_response, page_response = data
+            if not me_response or me_response.get('code') != 200:
+                return False, f"Token invalid: {_batch_error_message(me_response)}"
+            if not page_response or page_response.get('code') != 200:
+                return False, f"Token valid but cannot access page: {_batch_error_message(page_response)}"
+            return True, "Token is valid and can access page"
+        
         # Test token by getting user info
         url = "https://graph.facebook.com/v18.0/me"
         params = {'access_token': token}
-        response = requests.get(url, params=params, timeout=10)
+        response = _SESSION.get(url, params=params, timeout=GRAPH_TIMEOUT)
         
         if response.status_code == 200:
-            # If page_id provided, check if we can access that page
-            if page_id:
-                page_url = f"https://graph.facebook.com/v18.0/{page_id}"
-                page_params = {'access_token': token, 'fields': 'id,name'}
-                page_response = requests.get(page_url, params=page_params, timeout=10)
-                if page_response.status_code == 200:
-                    return True, "Token is valid and can access page"
-                else:
-                    return False, f"Token valid but cannot access page: {page_response.json().get('error', {}).get('message', 'Unknown error')}"
             return True, "Token is valid"
         else:
             error_data = response.json() if response.content else {}
@@ -139,6 +233,11 @@ def get_user_access_token(app_id, app_secret=None):
     with socketserver.TCPServer(("", 8080), OAuthCallbackHandler) as httpd:
         httpd.auth_code = None
         httpd.auth_error = None
+        httpd.callback_received = threading.Event()
+        
+        # Serve in the background so stray requests (e.g. /favicon.ico) don't
+        # use up the wait; stop as soon as the callback arrives
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
         
         try:
             webbrowser.open(auth_url)
@@ -147,8 +246,7 @@ def get_user_access_token(app_id, app_secret=None):
             print()
             
             # Wait for callback (timeout after 5 minutes)
-            httpd.timeout = 300
-            httpd.handle_request()
+            httpd.callback_received.wait(timeout=300)
             
             if httpd.auth_error:
                 print(f"❌ Authorization failed: {httpd.auth_error}")
@@ -169,6 +267,8 @@ def get_user_access_token(app_id, app_secret=None):
         except Exception as e:
             print(f"❌ Error during authorization: {e}")
             return None
+        finally:
+            httpd.shutdown()
     
     # Exchange code for access token
     print("🔄 Exchanging authorization code for access token...")
@@ -184,7 +284,7 @@ def get_user_access_token(app_id, app_secret=None):
         token_params['client_secret'] = app_secret
     
     try:
-        response = requests.get(token_url, params=token_params, timeout=10)
+        response = _SESSION.get(token_url, params=token_params, timeout=GRAPH_TIMEOUT)
         response.raise_for_status()
         
         token_data = response.json()
@@ -221,16 +321,28 @@ def get_page_access_token(user_token, target_page_id=None):
     pages_url = "https://graph.facebook.com/v18.0/me/accounts"
     pages_params = {
         'access_token': user_token,
-        'fields': 'id,name,access_token,category'
+        'fields': 'id,name,access_token,category',
+        'limit': 100
     }
     
     try:
-        response = requests.get(pages_url, params=pages_params, timeout=10)
+        response = _SESSION.get(pages_url, params=pages_params, timeout=GRAPH_TIMEOUT)
         response.raise_for_status()
         
         pages_data = response.json()
         pages = pages_data.get('data', [])
         
+        # Follow the paging cursor until the target page turns up, so it isn't
+        # missed just because it sits past the first page of results
+        while (
+            pages_data.get('paging', {}).get('next')
+            and not any(p.get('id') == target_page_id for p in pages_data.get('data', []))
+        ):
+            response = _SESSION.get(pages_data['paging']['next'], timeout=GRAPH_TIMEOUT)
+            response.raise_for_status()
+            pages_data = response.json()
+            pages.extend(pages_data.get('data', []))
+        
         if not pages:
             print("❌ No pages found.")
             print("   Make sure you have admin access to at least one Facebook Page.")
@@ -287,9 +399,14 @@ def get_page_access_token(user_token, target_page_id=None):
 
 
 def exchange_for_long_lived_token(short_token, app_id, app_secret):
-    """Exchange short-lived token for long-lived token."""
+    """
+    Exchange short-lived token for long-lived token.
+    
+    Returns (token, is_long_lived, expiry); expiry is a Unix timestamp, or
+    None when it isn't known.
+    """
     if not app_secret:
-        return short_token, False
+        return short_token, False, None
     
     print("🔄 Exchanging for long-lived token...")
     
@@ -302,7 +419,7 @@ def exchange_for_long_lived_token(short_token, app_id, app_secret):
     }
     
     try:
-        response = requests.get(exchange_url, params=exchange_params, timeout=10)
+        response = _SESSION.get(exchange_url, params=exchange_params, timeout=GRAPH_TIMEOUT)
         response.raise_for_status()
         
         exchange_data = response.json()
@@ -312,14 +429,36 @@ def exchange_for_long_lived_token(short_token, app_id, app_secret):
         
         if long_lived_token:
             print(f"✅ Long-lived token created! (expires in {days} days)")
-            return long_lived_token, True
+            expiry = int(time.time()) + expires_in if expires_in else None
+            return long_lived_token, True, expiry
         else:
             print("⚠️  Could not exchange token. Using short-lived token.")
-            return short_token, False
+            return short_token, False, None
     except Exception as e:
         print(f"⚠️  Could not exchange token: {e}")
         print("   Using short-lived token (expires in ~1 hour).")
-        return short_token, False
+        return short_token, False, None
+
+
+@contextlib.contextmanager
+def _config_lock():
+    """Hold an exclusive cross-process lock while tokens are exchanged and saved."""
+    with open('MY_CONFIG.json.lock', 'a+') as lock_file:
+        lock_file.seek(0)
+        if os.name == 'nt':
+            import msvcrt
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if os.name == 'nt':
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
 
 
 def create_facebook_token():
@@ -381,44 +520,65 @@ def create_facebook_token():
     
     page_token, page_id_found = result
     
-    # Step 3: Exchange for long-lived token (if App Secret available)
-    if app_secret:
-        page_token, is_long_lived = exchange_for_long_lived_token(page_token, app_id, app_secret)
-    else:
-        print("⚠️  App Secret not available. Using short-lived token.")
-        print("   Add App Secret to config for long-lived tokens (expires in ~60 days).")
-        is_long_lived = False
+    # Exchange and save under a lock so concurrent runs can't overwrite
+    # each other's freshly issued tokens
+    with _config_lock():
+        # Re-read settings; if another run saved a new token while this one
+        # was authorizing, keep that token instead of exchanging again
+        settings = load_settings_from_db()
+        api_keys = settings.get('api_keys', {})
+        saved_token = api_keys.get('facebook_page_access_token')
+        if saved_token and saved_token != existing_token:
+            print("✅ Another run just saved a new Page Access Token. Keeping it.")
+            return True
+        
+        # Step 3: Exchange for long-lived token (if App Secret available)
+        if app_secret:
+            page_token, is_long_lived, page_token_expiry = exchange_for_long_lived_token(
+                page_token, app_id, app_secret
+            )
+        else:
+            print("⚠️  App Secret not available. Using short-lived token.")
+            print("   Add App Secret to config for long-lived tokens (expires in ~60 days).")
+            is_long_lived = False
+            page_token_expiry = None
+            print()
+        
+        # Step 4: Save to config
+        print("📋 Step 3: Saving Configuration")
+        print("-" * 70)
         print()
-    
-    # Step 4: Save to config
-    print("📋 Step 3: Saving Configuration")
-    print("-" * 70)
-    print()
-    
-    api_keys['facebook_page_access_token'] = page_token
-    api_keys['facebook_page_id'] = page_id_found
-    
-    settings['api_keys'] = api_keys
-    save_settings_to_db(settings)
-    
-    # Also update MY_CONFIG.json
-    config_file = Path('MY_CONFIG.json')
-    if config_file.exists():
-        try:
-            with open(config_file, 'r') as f:
-                config = json.load(f)
-            
-            config['api_keys']['facebook_page_access_token'] = page_token
-            config['api_keys']['facebook_page_id'] = page_id_found
-            
-            with open(config_file, 'w') as f:
-                json.dump(config, f, indent=2)
-            
-            print("✅ Updated MY_CONFIG.json!")
-        except Exception as e:
-            print(f"⚠️  Could not update MY_CONFIG.json: {e}")
-            print("   But settings were saved to database.")
-    
+        
+        api_keys['facebook_page_access_token'] = page_token
+        api_keys['facebook_page_id'] = page_id_found
+        # Always overwrite the expiry so fetch_facebook_config never trusts
+        # a stale one left by the previous token
+        api_keys['facebook_page_access_token_expiry'] = page_token_expiry
+        
+        settings['api_keys'] = api_keys
+        save_settings_to_db(settings)
+        
+        # Also update MY_CONFIG.json
+        config_file = Path('MY_CONFIG.json')
+        if config_file.exists():
+            try:
+                config = json.loads(config_file.read_text())
+                
+                config['api_keys']['facebook_page_access_token'] = page_token
+                config['api_keys']['facebook_page_id'] = page_id_found
+                config['api_keys']['facebook_page_access_token_expiry'] = page_token_expiry
+                
+                # Swap the new file in atomically so a killed run can't leave
+                # a half-written config behind
+                tmp_file = config_file.with_suffix('.json.tmp')
+                tmp_file.write_text(json.dumps(config, indent=2))
+                os.replace(tmp_file, config_file)
+                
+                print("✅ Updated MY_CONFIG.json!")
+            except Exception as e:
+                print(f"⚠️  Could not update MY_CONFIG.json: {e}")
+                print("   But settings were saved to database.")
+        
     print()
     print("=" * 70)
     print("✅ Token Created Successfully!")
@@ -3,14 +3,18 @@ Download all videos from YouTube Shorts playlists.
 Organizes videos into folders by playlist name.
 """
 
+import functools
+import importlib
+import json
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from googleapiclient.discovery import build
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
 import subprocess
-import re
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -19,24 +23,67 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 DOWNLOAD_BASE_DIR = "data/shorts_downloads"
 TOKEN_FILE = "token.json"
 SCOPES = ["https://www.googleapis.com/auth/youtube.readonly"]
+# Concurrent yt-dlp downloads per playlist; kept small to avoid rate limiting
+DOWNLOAD_WORKERS = max(1, int(os.getenv("SHORTS_DL_WORKERS", "4")))
+# Maps playlist ID to its download folder, so renamed playlists keep theirs
+PLAYLIST_INDEX_FILE = ".index.json"
 
 
+# Translation table deleting characters that are invalid in filenames
+_INVALID_FILENAME_CHARS = str.maketrans("", "", '<>:"/\\|?*')
+
+
+@functools.lru_cache(maxsize=4096)
 def sanitize_filename(filename):
     """Remove invalid characters from filename."""
     # Remove invalid characters for filesystem
-    filename = re.sub(r'[<>:"/\\|?*]', "", filename)
-    # Replace multiple spaces with single space
-    filename = re.sub(r"\s+", " ", filename)
-    # Trim whitespace
-    filename = filename.strip()
+    filename = filename.translate(_INVALID_FILENAME_CHARS)
+    # Collapse whitespace runs to single spaces and trim the ends
+    filename = " ".join(filename.split())
     # Limit length
     if len(filename) > 200:
         filename = filename[:200]
     return filename
 
 
-def get_youtube_service():
-    """Get authenticated YouTube API service."""
+def existing_file_prefixes(directory):
+    """
+    Collect every prefix P for which a file named "P.<anything>" exists.
+
+    Turns the per-video "already downloaded?" glob into a set lookup, with
+    one directory scan per playlist.
+    """
+    prefixes = set()
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            name = entry.name
+            dot = name.find(".")
+            while dot != -1:
+                prefixes.add(name[:dot])
+                dot = name.find(".", dot + 1)
+    return prefixes
+
+
+def load_playlist_index(base_dir):
+    """Load the playlist ID -> folder index, or an empty one if there is none."""
+    try:
+        with open(base_dir / PLAYLIST_INDEX_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_playlist_index(base_dir, index):
+    """Atomically write the playlist ID -> folder index."""
+    index_file = base_dir / PLAYLIST_INDEX_FILE
+    tmp_file = index_file.with_name(index_file.name + ".tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2)
+    os.replace(tmp_file, index_file)
+
+
+def get_youtube_credentials():
+    """Load (and if needed refresh) the saved YouTube credentials."""
     creds = None
 
     if os.path.exists(TOKEN_FILE):
@@ -50,7 +97,7 @@ def get_youtube_service():
             print("   Please authenticate via the web app Settings page first.")
             return None
 
-    return build("youtube", "v3", credentials=creds)
+    return creds
 
 
 def get_my_playlists(youtube):
@@ -65,6 +112,7 @@ def get_my_playlists(youtube):
                 mine=True,
                 maxResults=50,
                 pageToken=next_page_token,
+                fields="nextPageToken,items(id,snippet/title,contentDetails/itemCount)",
             )
             response = request.execute()
 
@@ -93,13 +141,17 @@ def get_playlist_videos(youtube, playlist_id):
                 playlistId=playlist_id,
                 maxResults=50,
                 pageToken=next_page_token,
+                fields="nextPageToken,items(contentDetails/videoId,snippet/title)",
             )
             response = request.execute()
 
-            for item in response.get("items", []):
-                video_id = item["contentDetails"]["videoId"]
-                video_title = item["snippet"]["title"]
-                videos.append({"id": video_id, "title": video_title})
+            videos.extend(
+                {
+                    "id": item["contentDetails"]["videoId"],
+                    "title": item["snippet"]["title"],
+                }
+                for item in response.get("items", [])
+            )
 
             next_page_token = response.get("nextPageToken")
             if not next_page_token:
@@ -111,19 +163,41 @@ def get_playlist_videos(youtube, playlist_id):
     return videos
 
 
+def fetch_playlists_videos(creds, playlist_ids, max_workers=8):
+    """
+    List the videos of several playlists concurrently.
+
+    Each worker builds its own YouTube client from the shared credentials
+    because httplib2 connections are not thread-safe. Returns a dict mapping
+    playlist ID to its videos.
+    """
+    worker_state = threading.local()
+
+    def fetch_one(playlist_id):
+        if not hasattr(worker_state, "youtube"):
+            worker_state.youtube = build("youtube", "v3", credentials=creds)
+        return get_playlist_videos(worker_state.youtube, playlist_id)
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(playlist_ids)))
+    ) as executor:
+        return dict(zip(playlist_ids, executor.map(fetch_one, playlist_ids)))
+
+
 def check_ytdlp_installed():
-    """Check if yt-dlp is installed."""
+    """Check if the yt-dlp Python package is installed."""
     try:
-        result = subprocess.run(["yt-dlp", "--version"], capture_output=True, text=True)
-        if result.returncode == 0:
-            print(f"✅ yt-dlp version: {result.stdout.strip()}")
-            return True
-    except FileNotFoundError:
+        import yt_dlp
+
+        print(f"✅ yt-dlp version: {yt_dlp.version.__version__}")
+        return True
+    except ImportError:
         pass
 
     print("❌ yt-dlp not found. Installing...")
     try:
         subprocess.run([sys.executable, "-m", "pip", "install", "yt-dlp"], check=True)
+        importlib.invalidate_caches()
         print("✅ yt-dlp installed successfully")
         return True
     except Exception as e:
@@ -131,57 +205,57 @@ def check_ytdlp_installed():
         return False
 
 
-def download_video(video_id, video_title, output_dir, use_cookies=True):
-    """Download a single video using yt-dlp with cookie authentication."""
+def get_cookie_browser():
+    """
+    Find the first browser yt-dlp can read cookies from.
+
+    Call once per run, before any downloads start, and pass the result to
+    download_video. Returns None if no browser's cookies can be read.
+    """
+    from yt_dlp.cookies import extract_cookies_from_browser
+
+    for browser in ["chrome", "firefox", "safari", "edge"]:
+        try:
+            extract_cookies_from_browser(browser)
+            return browser
+        except Exception:
+            continue
+    return None
+
+
+def download_video(video_id, video_title, output_dir, cookie_browser=None):
+    """Download a single video in-process with yt-dlp and cookie authentication."""
+    import yt_dlp
+
     url = f"https://www.youtube.com/watch?v={video_id}"
 
     # Create sanitized filename
     safe_title = sanitize_filename(video_title)
 
-    # yt-dlp command with options
-    cmd = [
-        "yt-dlp",
-        "-f",
-        "best",  # Best quality
-        "--no-playlist",  # Don't download playlists
-        "-o",
-        os.path.join(output_dir, f"{safe_title}.%(ext)s"),  # Output template
-        "--no-overwrites",  # Skip if file exists
-        "--quiet",  # Suppress output
-        "--progress",  # Show progress
-    ]
+    # yt-dlp options; a fresh YoutubeDL per call keeps parallel downloads
+    # from sharing mutable state
+    ydl_opts = {
+        "format": "best",  # Best quality
+        "noplaylist": True,  # Don't download playlists
+        "outtmpl": os.path.join(output_dir, f"{safe_title}.%(ext)s"),
+        "overwrites": False,  # Skip if file exists
+        "quiet": True,  # Suppress output
+        "no_warnings": True,
+        "noprogress": True,
+    }
 
     # Add cookie authentication to access private/unlisted videos
-    if use_cookies:
-        # Try multiple browsers in order of preference
-        browsers = ["chrome", "firefox", "safari", "edge"]
-        for browser in browsers:
-            try:
-                # Test if cookies can be extracted from this browser
-                test_cmd = [
-                    "yt-dlp",
-                    "--cookies-from-browser",
-                    browser,
-                    "--skip-download",
-                    "--quiet",
-                    "https://www.youtube.com/",
-                ]
-                result = subprocess.run(test_cmd, capture_output=True, timeout=5)
-                if result.returncode == 0:
-                    cmd.extend(["--cookies-from-browser", browser])
-                    break
-            except (subprocess.TimeoutExpired, Exception):
-                continue
-
-    cmd.append(url)
+    if cookie_browser:
+        ydl_opts["cookiesfrombrowser"] = (cookie_browser,)
 
     try:
-        subprocess.run(cmd, check=True, capture_output=True)
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            ydl.download([url])
         return True
-    except subprocess.CalledProcessError as e:
+    except yt_dlp.utils.DownloadError as e:
         # Try without cookies if cookie auth failed
-        if use_cookies:
-            return download_video(video_id, video_title, output_dir, use_cookies=False)
+        if cookie_browser:
+            return download_video(video_id, video_title, output_dir)
         print(f"      ❌ Failed to download: {e}")
         return False
     except Exception as e:
@@ -203,9 +277,12 @@ def main():
     print()
 
     # Get YouTube service
-    youtube = get_youtube_service()
-    if not youtube:
+    # Load the credentials once; the playlist workers each build their own
+    # client around them instead of re-reading and refreshing token.json
+    creds = get_youtube_credentials()
+    if not creds:
         return
+    youtube = build("youtube", "v3", credentials=creds)
 
     print("✅ YouTube authenticated successfully")
     print()
@@ -238,6 +315,17 @@ def main():
     print(f"📂 Download location: {base_dir.absolute()}")
     print()
 
+    # List every playlist's videos up front, in parallel
+    print("📋 Listing playlist videos...")
+    playlist_videos = fetch_playlists_videos(creds, [p["id"] for p in shorts_playlists])
+    print()
+
+    playlist_index = load_playlist_index(base_dir)
+
+    # Find the cookie browser once, before the download pool starts, so the
+    # workers don't each read and decrypt the browser's cookie store
+    cookie_browser = get_cookie_browser()
+
     # Download each playlist
     total_downloaded = 0
     total_skipped = 0
@@ -250,45 +338,79 @@ def main():
 
         print(f"[{idx}/{len(shorts_playlists)}] Processing: {playlist_title}")
 
-        # Create playlist directory
-        safe_playlist_name = sanitize_filename(playlist_title)
-        playlist_dir = base_dir / safe_playlist_name
-        playlist_dir.mkdir(parents=True, exist_ok=True)
+        # Reuse the folder recorded for this playlist so a renamed playlist
+        # doesn't re-download everything into a new folder
+        entry = playlist_index.get(playlist_id)
+        if entry and (base_dir / entry["dir"]).is_dir():
+            playlist_dir = base_dir / entry["dir"]
+        else:
+            # Create playlist directory
+            playlist_dir = base_dir / sanitize_filename(playlist_title)
+            playlist_dir.mkdir(parents=True, exist_ok=True)
+        playlist_index[playlist_id] = {
+            "dir": playlist_dir.name,
+            "title": playlist_title,
+        }
 
         print(f"   📁 {playlist_dir}")
 
         # Get videos in playlist
-        videos = get_playlist_videos(youtube, playlist_id)
+        videos = playlist_videos[playlist_id]
         print(f"   📹 {len(videos)} videos to download")
 
-        # Download each video
+        # Skip videos that already exist before scheduling any downloads
+        existing = existing_file_prefixes(playlist_dir)
+        to_download = []
         for video_idx, video in enumerate(videos, 1):
-            video_id = video["id"]
             video_title = video["title"]
 
             # Check if file already exists
-            existing_files = list(
-                playlist_dir.glob(f"{sanitize_filename(video_title)}.*")
-            )
-            if existing_files:
+            safe_title = sanitize_filename(video_title)
+            if safe_title in existing:
                 print(
                     f"      [{video_idx}/{len(videos)}] ⏭️  Skipped (exists): {video_title[:50]}..."
                 )
                 total_skipped += 1
                 continue
 
-            print(
-                f"      [{video_idx}/{len(videos)}] ⬇️  Downloading: {video_title[:50]}..."
-            )
+            to_download.append((video_idx, video))
+            # Same-titled videos later in the playlist would write the same file
+            existing.add(safe_title)
 
-            if download_video(video_id, video_title, str(playlist_dir)):
-                print(f"      ✅ Downloaded successfully")
-                total_downloaded += 1
-            else:
-                total_failed += 1
+        # Downloads are network-bound and yt-dlp releases the GIL while
+        # waiting, so run several at once
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as pool:
+            futures = {}
+            for video_idx, video in to_download:
+                print(
+                    f"      [{video_idx}/{len(videos)}] ⬇️  Downloading: {video['title'][:50]}..."
+                )
+                future = pool.submit(
+                    download_video,
+                    video["id"],
+                    video["title"],
+                    str(playlist_dir),
+                    cookie_browser,
+                )
+                futures[future] = (video_idx, video)
+
+            for future in as_completed(futures):
+                video_idx, video = futures[future]
+                if future.result():
+                    print(
+                        f"      [{video_idx}/{len(videos)}] ✅ Downloaded successfully"
+                    )
+                    total_downloaded += 1
+                else:
+                    total_failed += 1
 
         print()
 
+    try:
+        save_playlist_index(base_dir, playlist_index)
+    except OSError as e:
+        print(f"⚠️  Could not save playlist index: {e}")
+
     # Summary
     print("=" * 80)
     print("Download Summary")
@@ -5,64 +5,116 @@ Downloads all playlists with "short" in the name and exports video information t
 Each playlist gets its own tab with: title, description, tags, playlist ID, video URL, playlist URL
 """
 
-import os
 import sys
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CONFIG_DIR = REPO_ROOT / "config"
+DATA_DIR = REPO_ROOT / "data"
+
 # Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(REPO_ROOT))
 
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
+# googleapiclient.discovery, google_auth_oauthlib and openpyxl are slow to
+# import, so they are imported inside the functions that use them
 from googleapiclient.errors import HttpError
-import pandas as pd
-import pickle
 
 # YouTube API scopes
 SCOPES = ["https://www.googleapis.com/auth/youtube.readonly"]
 
+# Columns of each playlist sheet
+EXPORT_COLUMNS = [
+    "Title",
+    "Description",
+    "Tags",
+    "Playlist ID",
+    "Video URL",
+    "Playlist URL",
+]
 
-def get_authenticated_service():
-    """Authenticate and return YouTube API service."""
-    creds = None
-    token_path = Path(__file__).parent.parent / "config" / "token.json"
-    client_secret_path = Path(__file__).parent.parent / "config" / "client_secret.json"
+# Excel sheet names are limited to 31 chars and may not contain :\/?*[]
+SHEET_NAME_MAX_LEN = 31
+_SHEET_NAME_TRANS = str.maketrans({c: "_" for c in ":\\/?*[]"})
+
+
+# (token file mtime, Credentials) from the last successful load
+_creds_cache = None
+_creds_lock = threading.Lock()
+
+
+def get_credentials():
+    """
+    Load, refresh or obtain the user's OAuth credentials.
+
+    Credentials are kept in-process and reused while token.json is unchanged
+    and the access token is still valid, so repeated calls (e.g. one per
+    worker thread) skip re-parsing and refresh checks.
+    """
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
+    from google_auth_oauthlib.flow import InstalledAppFlow
+
+    global _creds_cache
 
-    # Token file stores the user's access and refresh tokens
-    if token_path.exists():
+    token_path = CONFIG_DIR / "token.json"
+    client_secret_path = CONFIG_DIR / "client_secret.json"
+
+    with _creds_lock:
         try:
-            with open(token_path, "r") as token:
-                token_data = json.load(token)
-                creds = Credentials.from_authorized_user_info(token_data, SCOPES)
-        except Exception as e:
-            print(f"Error loading token: {e}")
-
-    # If there are no (valid) credentials available, let the user log in
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            print("Refreshing expired credentials...")
-            creds.refresh(Request())
-        else:
-            if not client_secret_path.exists():
-                print(f"❌ Error: client_secret.json not found at {client_secret_path}")
-                print("Please set up OAuth credentials first.")
-                sys.exit(1)
-
-            print("Starting OAuth authentication flow...")
-            flow = InstalledAppFlow.from_client_secrets_file(
-                str(client_secret_path), SCOPES
-            )
-            creds = flow.run_local_server(port=0)
+            token_mtime = token_path.stat().st_mtime
+        except OSError:
+            token_mtime = None
+        if _creds_cache and _creds_cache[0] == token_mtime and _creds_cache[1].valid:
+            return _creds_cache[1]
+
+        creds = None
+
+        # Token file stores the user's access and refresh tokens
+        if token_mtime is not None:
+            try:
+                with open(token_path, "r") as token:
+                    token_data = json.load(token)
+                    creds = Credentials.from_authorized_user_info(token_data, SCOPES)
+            except Exception as e:
+                print(f"Error loading token: {e}")
+
+        # If there are no (valid) credentials available, let the user log in
+        if not creds or not creds.valid:
+            if creds and creds.expired and creds.refresh_token:
+                print("Refreshing expired credentials...")
+                creds.refresh(Request())
+            else:
+                if not client_secret_path.exists():
+                    print(
+                        f"❌ Error: client_secret.json not found at {client_secret_path}"
+                    )
+                    print("Please set up OAuth credentials first.")
+                    sys.exit(1)
+
+                print("Starting OAuth authentication flow...")
+                flow = InstalledAppFlow.from_client_secrets_file(
+                    str(client_secret_path), SCOPES
+                )
+                creds = flow.run_local_server(port=0)
 
-        # Save the credentials for the next run
-        with open(token_path, "w") as token:
-            token.write(creds.to_json())
+            # Save the credentials for the next run
+            with open(token_path, "w") as token:
+                token.write(creds.to_json())
+            token_mtime = token_path.stat().st_mtime
 
-    return build("youtube", "v3", credentials=creds)
+        _creds_cache = (token_mtime, creds)
+        return creds
+
+
+def get_authenticated_service():
+    """Authenticate and return YouTube API service."""
+    from googleapiclient.discovery import build
+
+    return build("youtube", "v3", credentials=get_credentials())
 
 
 def get_my_playlists(youtube):
@@ -75,10 +127,11 @@ def get_my_playlists(youtube):
     while True:
         try:
             request = youtube.playlists().list(
-                part="snippet,contentDetails",
+                part="snippet",
                 mine=True,
                 maxResults=50,
                 pageToken=next_page_token,
+                fields="nextPageToken,items(id,snippet/title)",
             )
             response = request.execute()
 
@@ -103,10 +156,11 @@ def get_playlist_videos(youtube, playlist_id):
     while True:
         try:
             request = youtube.playlistItems().list(
-                part="snippet,contentDetails",
+                part="contentDetails",
                 playlistId=playlist_id,
                 maxResults=50,
                 pageToken=next_page_token,
+                fields="nextPageToken,items(contentDetails/videoId)",
             )
             response = request.execute()
 
@@ -123,8 +177,28 @@ def get_playlist_videos(youtube, playlist_id):
     return videos
 
 
+def fetch_playlists_videos(playlist_ids, max_workers=8):
+    """
+    List the videos of several playlists concurrently.
+
+    Each worker builds its own YouTube client because httplib2 connections
+    are not thread-safe. Returns a dict mapping playlist ID to its videos.
+    """
+    worker_state = threading.local()
+
+    def fetch_one(playlist_id):
+        if not hasattr(worker_state, "youtube"):
+            worker_state.youtube = get_authenticated_service()
+        return get_playlist_videos(worker_state.youtube, playlist_id)
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(playlist_ids)))
+    ) as executor:
+        return dict(zip(playlist_ids, executor.map(fetch_one, playlist_ids)))
+
+
 def get_video_details(youtube, video_ids):
-    """Fetch detailed information for videos including tags."""
+    """Fetch title, description and tags for videos."""
     if not video_ids:
         return []
 
@@ -134,7 +208,11 @@ def get_video_details(youtube, video_ids):
     for i in range(0, len(video_ids), 50):
         batch_ids = video_ids[i : i + 50]
         try:
-            request = youtube.videos().list(part="snippet", id=",".join(batch_ids))
+            request = youtube.videos().list(
+                part="snippet",
+                id=",".join(batch_ids),
+                fields="items(id,snippet(title,description,tags))",
+            )
             response = request.execute()
             video_details.extend(response.get("items", []))
         except HttpError as e:
@@ -145,6 +223,10 @@ def get_video_details(youtube, video_ids):
 
 def export_to_excel(playlists_data, output_file):
     """Export playlist data to Excel with one tab per playlist."""
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+    from openpyxl.utils import get_column_letter
 
     if not playlists_data:
         print("❌ No playlist data to export")
@@ -152,48 +234,68 @@ def export_to_excel(playlists_data, output_file):
 
     print(f"\n📊 Creating Excel file: {output_file}")
 
-    with pd.ExcelWriter(output_file, engine="openpyxl") as writer:
-        for playlist_info in playlists_data:
-            playlist_name = playlist_info["name"]
-            videos = playlist_info["videos"]
-            playlist_id = playlist_info["playlist_id"]
-            playlist_url = f"https://www.youtube.com/playlist?list={playlist_id}"
-
-            # Create dataframe for this playlist
-            df_data = []
-            for video in videos:
-                df_data.append(
-                    {
-                        "Title": video["title"],
-                        "Description": video["description"],
-                        "Tags": video["tags"],
-                        "Playlist ID": playlist_id,
-                        "Video URL": video["video_url"],
-                        "Playlist URL": playlist_url,
-                    }
-                )
-
-            df = pd.DataFrame(df_data)
-
-            # Sanitize sheet name (Excel has limitations)
-            sheet_name = playlist_name[:31]  # Excel sheet name limit is 31 chars
-            # Remove invalid characters for Excel sheet names
-            invalid_chars = [":", "\\", "/", "?", "*", "[", "]"]
-            for char in invalid_chars:
-                sheet_name = sheet_name.replace(char, "_")
-
-            # Write to Excel
-            df.to_excel(writer, sheet_name=sheet_name, index=False)
-
-            # Auto-adjust column widths
-            worksheet = writer.sheets[sheet_name]
-            for idx, col in enumerate(df.columns):
-                max_length = max(df[col].astype(str).apply(len).max(), len(col))
-                # Set a reasonable max width
-                max_length = min(max_length, 100)
-                worksheet.column_dimensions[chr(65 + idx)].width = max_length + 2
-
-            print(f"   ✅ Added sheet: {sheet_name} ({len(df)} videos)")
+    # Write-only mode streams each row out instead of holding every cell of
+    # every sheet in memory until save
+    workbook = Workbook(write_only=True)
+    header_font = Font(bold=True)
+    used_sheet_names = set()
+
+    for playlist_info in playlists_data:
+        playlist_name = playlist_info["name"]
+        videos = playlist_info["videos"]
+        playlist_id = playlist_info["playlist_id"]
+        playlist_url = f"https://www.youtube.com/playlist?list={playlist_id}"
+
+        rows = [
+            (
+                video["title"],
+                video["description"],
+                video["tags"],
+                playlist_id,
+                video["video_url"],
+                playlist_url,
+            )
+            for video in videos
+        ]
+
+        # Sanitize sheet name (Excel has limitations)
+        sheet_name = playlist_name[:SHEET_NAME_MAX_LEN].translate(_SHEET_NAME_TRANS)
+        # Long names that only differ past the cut (or in case, which Excel
+        # ignores) would collide; give repeats a numbered suffix
+        suffix = 1
+        base_name = sheet_name
+        while sheet_name.casefold() in used_sheet_names:
+            suffix += 1
+            sheet_name = f"{base_name[:SHEET_NAME_MAX_LEN - 3]}_{suffix:02d}"
+        used_sheet_names.add(sheet_name.casefold())
+
+        worksheet = workbook.create_sheet(title=sheet_name)
+
+        # Auto-adjust column widths; write-only sheets need these set before
+        # any rows are appended, so measure the rows in one pass first
+        widths = [len(header) for header in EXPORT_COLUMNS]
+        for row in rows:
+            for idx, value in enumerate(row):
+                if len(value) > widths[idx]:
+                    widths[idx] = len(value)
+        for idx, width in enumerate(widths):
+            # Set a reasonable max width
+            column_letter = get_column_letter(idx + 1)
+            worksheet.column_dimensions[column_letter].width = min(width, 100) + 2
+
+        # Write to Excel
+        header_row = []
+        for header in EXPORT_COLUMNS:
+            cell = WriteOnlyCell(worksheet, value=header)
+            cell.font = header_font
+            header_row.append(cell)
+        worksheet.append(header_row)
+        for row in rows:
+            worksheet.append(row)
+
+        print(f"   ✅ Added sheet: {sheet_name} ({len(rows)} videos)")
+
+    workbook.save(output_file)
 
     print(f"\n✅ Excel file created successfully!")
     print(f"   Location: {output_file}")
@@ -217,56 +319,64 @@ def main():
     all_playlists = get_my_playlists(youtube)
     print(f"📋 Found {len(all_playlists)} total playlists\n")
 
-    # Filter playlists with "short" in the name (case-insensitive)
-    shorts_playlists = [
-        p for p in all_playlists if "short" in p["snippet"]["title"].lower()
-    ]
+    # Filter playlists with "short" in the name (case-insensitive), keeping
+    # the title alongside each playlist so it is only looked up once
+    shorts_playlists = []
+    for p in all_playlists:
+        title = p["snippet"]["title"]
+        if "short" in title.casefold():
+            shorts_playlists.append((title, p))
 
     if not shorts_playlists:
         print("❌ No playlists found with 'short' in the name")
         return
 
     print(f"🎯 Found {len(shorts_playlists)} Shorts playlists:")
-    for p in shorts_playlists:
-        print(f"   - {p['snippet']['title']}")
+    for title, _ in shorts_playlists:
+        print(f"   - {title}")
     print()
 
-    # Fetch videos for each Shorts playlist
-    playlists_data = []
+    # Fetch videos for every Shorts playlist in parallel
+    videos_by_playlist = fetch_playlists_videos([p["id"] for _, p in shorts_playlists])
+    playlist_items = []
 
-    for idx, playlist in enumerate(shorts_playlists, 1):
-        playlist_title = playlist["snippet"]["title"]
+    for idx, (playlist_title, playlist) in enumerate(shorts_playlists, 1):
         playlist_id = playlist["id"]
+        playlist_videos = videos_by_playlist[playlist_id]
 
-        print(f"[{idx}/{len(shorts_playlists)}] Processing: {playlist_title}")
+        print(f"[{idx}/{len(shorts_playlists)}] {playlist_title}")
+        print(f"   Found {len(playlist_videos)} videos\n")
 
-        # Get videos in this playlist
-        playlist_videos = get_playlist_videos(youtube, playlist_id)
-        print(f"   Found {len(playlist_videos)} videos")
+        if playlist_videos:
+            playlist_items.append((playlist_title, playlist_id, playlist_videos))
 
-        if not playlist_videos:
-            continue
-
-        # Get video IDs
-        video_ids = [v["contentDetails"]["videoId"] for v in playlist_videos]
+    # Get video information (title, description, tags) once for every unique
+    # video, since the same Short often sits in several playlists
+    video_ids = list(
+        dict.fromkeys(
+            v["contentDetails"]["videoId"]
+            for _, _, playlist_videos in playlist_items
+            for v in playlist_videos
+        )
+    )
+    print(f"🔎 Fetching details for {len(video_ids)} unique videos...")
+    video_details = get_video_details(youtube, video_ids)
 
-        # Get detailed video information (including tags)
-        print(f"   Fetching video details...")
-        video_details = get_video_details(youtube, video_ids)
+    # Create a mapping of video ID to details
+    details_map = {v["id"]: v for v in video_details}
+    print()
 
-        # Create a mapping of video ID to details
-        details_map = {v["id"]: v for v in video_details}
+    # Compile video information
+    playlists_data = []
 
-        # Compile video information
+    for playlist_title, playlist_id, playlist_videos in playlist_items:
         videos_info = []
         for video in playlist_videos:
             video_id = video["contentDetails"]["videoId"]
-            snippet = video["snippet"]
 
-            # Get tags from detailed info
-            tags = []
-            if video_id in details_map:
-                tags = details_map[video_id]["snippet"].get("tags", [])
+            # Deleted/private videos are missing from the details response
+            snippet = details_map.get(video_id, {}).get("snippet", {})
+            tags = snippet.get("tags", [])
 
             videos_info.append(
                 {
@@ -278,16 +388,18 @@ def main():
             )
 
         playlists_data.append(
-            {"name": playlist_title, "playlist_id": playlist_id, "videos": videos_info}
+            {
+                "name": playlist_title,
+                "playlist_id": playlist_id,
+                "videos": videos_info,
+            }
         )
-        print(f"   ✅ Processed {len(videos_info)} videos\n")
 
     # Export to Excel
-    output_dir = Path(__file__).parent.parent / "data"
-    output_dir.mkdir(exist_ok=True)
+    DATA_DIR.mkdir(exist_ok=True)
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_file = output_dir / f"shorts_playlists_{timestamp}.xlsx"
+    output_file = DATA_DIR / f"shorts_playlists_{timestamp}.xlsx"
 
     export_to_excel(playlists_data, str(output_file))
 
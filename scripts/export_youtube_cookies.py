@@ -6,6 +6,22 @@ This allows yt-dlp to download private/unlisted videos
 import os
 import subprocess
 import sys
+import threading
+
+# Give up on yt-dlp after this many seconds
+EXPORT_TIMEOUT = 30
+
+# yt-dlp prints this as soon as it finds Chrome holding its cookie database
+CHROME_LOCKED_MESSAGE = "Could not copy Chrome cookie database"
+
+
+def print_manual_export_steps(cookies_file):
+    print()
+    print("Alternative method:")
+    print("1. Install 'Get cookies.txt' Chrome extension")
+    print("2. Go to youtube.com and click the extension")
+    print("3. Download cookies.txt file")
+    print(f"4. Save it to: {os.path.abspath(cookies_file)}")
 
 
 def export_cookies():
@@ -34,9 +50,44 @@ def export_cookies():
     ]
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        # Stream yt-dlp's output as it runs so a locked Chrome database is
+        # spotted within a second or two instead of waiting out the timeout
+        with subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        ) as proc:
+            timed_out = threading.Event()
+
+            def kill_on_timeout():
+                timed_out.set()
+                proc.kill()
+
+            watchdog = threading.Timer(EXPORT_TIMEOUT, kill_on_timeout)
+            watchdog.start()
+            chrome_locked = False
+            try:
+                for line in proc.stdout:
+                    sys.stderr.write(line)
+                    if CHROME_LOCKED_MESSAGE in line:
+                        chrome_locked = True
+                        proc.terminate()
+                        break
+                proc.wait(timeout=EXPORT_TIMEOUT)
+            finally:
+                watchdog.cancel()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, EXPORT_TIMEOUT)
+
+        if chrome_locked:
+            print("❌ Chrome is locking its cookie database - close Chrome and retry")
+            print_manual_export_steps(cookies_file)
+            return False
 
-        if result.returncode == 0 and os.path.exists(cookies_file):
+        if proc.returncode == 0 and os.path.exists(cookies_file):
             print(f"✅ Cookies exported successfully to {cookies_file}")
             print()
             print("You can now run download_shorts_playlists.py to download")
@@ -45,19 +96,12 @@ def export_cookies():
             print(f"Cookie file location: {os.path.abspath(cookies_file)}")
             return True
         else:
-            print("❌ Failed to export cookies")
-            if result.stderr:
-                print(f"Error: {result.stderr}")
+            print("❌ Failed to export cookies (see yt-dlp output above)")
             return False
 
     except subprocess.TimeoutExpired:
         print("❌ Timeout - Chrome may be locked or cookies are encrypted")
-        print()
-        print("Alternative method:")
-        print("1. Install 'Get cookies.txt' Chrome extension")
-        print("2. Go to youtube.com and click the extension")
-        print("3. Download cookies.txt file")
-        print(f"4. Save it to: {os.path.abspath(cookies_file)}")
+        print_manual_export_steps(cookies_file)
         return False
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -5,6 +5,7 @@ Similar to YouTube authentication - opens browser, gets authorization, fetches a
 
 Usage:
     python3 scripts/fetch_facebook_config.py
+    python3 scripts/fetch_facebook_config.py --force   # re-authorize even if the saved token is valid
     
     Or use the helper script:
     ./scripts/run_with_venv.sh fetch_facebook_config.py
@@ -13,6 +14,7 @@ Usage:
 import sys
 import os
 import json
+import time
 import webbrowser
 import http.server
 import socketserver
@@ -20,12 +22,30 @@ import urllib.parse
 from urllib.parse import urlparse, parse_qs
 import requests
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.database import load_settings_from_db, save_settings_to_db
 
+# Shared session so the Graph API calls below reuse one keep-alive connection
+# instead of paying a fresh TLS handshake each
+_SESSION = requests.Session()
+_SESSION.headers.update({'User-Agent': 'youtube-automation-suite/fetch_facebook_config'})
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+))
+
+# Without a timeout a stalled Graph API response hangs the script indefinitely
+GRAPH_TIMEOUT = 30
+
+# A saved token with more than this much life left is reused without OAuth
+TOKEN_MIN_REMAINING = 24 * 60 * 60
+
 # Configuration
 REDIRECT_URI = "http://localhost:8080/callback"
 SCOPES = [
@@ -37,7 +57,12 @@ SCOPES = [
     'pages_show_list'
 ]
 
-class OAuthCallbackHandler(http.server.SimpleHTTPRequestHandler):
+class OAuthCallbackServer(socketserver.TCPServer):
+    """One-shot callback server that can re-bind port 8080 straight after a previous run."""
+    allow_reuse_address = True
+
+
+class OAuthCallbackHandler(http.server.BaseHTTPRequestHandler):
     """Handle OAuth callback."""
     
     def do_GET(self):
@@ -89,7 +114,26 @@ class OAuthCallbackHandler(http.server.SimpleHTTPRequestHandler):
         pass
 
 
-def get_facebook_config():
+def saved_token_is_valid(page_token, page_id, expiry):
+    """Check a saved Page token still has a day left and still works."""
+    if not page_token or not page_id or not expiry:
+        return False
+    if expiry - time.time() <= TOKEN_MIN_REMAINING:
+        return False
+    
+    try:
+        response = _SESSION.get(
+            "https://graph.facebook.com/v18.0/me",
+            params={'access_token': page_token, 'fields': 'id'},
+            timeout=GRAPH_TIMEOUT
+        )
+    except requests.exceptions.RequestException:
+        return False
+    
+    return response.status_code == 200 and response.json().get('id') == page_id
+
+
+def get_facebook_config(force=False):
     """Fetch all Facebook configuration data using OAuth."""
     print("=" * 70)
     print("🔑 Facebook Configuration Auto-Fetcher")
@@ -126,6 +170,16 @@ def get_facebook_config():
         print(f"📄 Page ID: {page_id}")
     print()
     
+    # Skip the browser flow while the saved long-lived token is still good
+    token_expiry = api_keys.get('facebook_page_access_token_expiry')
+    if not force and saved_token_is_valid(
+        api_keys.get('facebook_page_access_token'), page_id, token_expiry
+    ):
+        days_left = int(token_expiry - time.time()) // 86400
+        print(f"✅ Saved Page Access Token is valid for {days_left} more days.")
+        print("   Run with --force to re-authorize anyway.")
+        return True
+    
     # Step 1: Get authorization code
     print("📋 Step 1: Getting Authorization")
     print("-" * 70)
@@ -149,7 +203,7 @@ def get_facebook_config():
     print()
     
     # Start local server to receive callback
-    with socketserver.TCPServer(("", 8080), OAuthCallbackHandler) as httpd:
+    with OAuthCallbackServer(("", 8080), OAuthCallbackHandler) as httpd:
         httpd.auth_code = None
         httpd.auth_error = None
         
@@ -199,7 +253,7 @@ def get_facebook_config():
     print("🔄 Exchanging authorization code for access token...")
     
     try:
-        response = requests.get(token_url, params=token_params)
+        response = _SESSION.get(token_url, params=token_params, timeout=GRAPH_TIMEOUT)
         response.raise_for_status()
         
         token_data = response.json()
@@ -237,7 +291,7 @@ def get_facebook_config():
     }
     
     try:
-        response = requests.get(pages_url, params=pages_params)
+        response = _SESSION.get(pages_url, params=pages_params, timeout=GRAPH_TIMEOUT)
         response.raise_for_status()
         
         pages_data = response.json()
@@ -317,7 +371,7 @@ def get_facebook_config():
     instagram_username = None
     
     try:
-        response = requests.get(ig_url, params=ig_params)
+        response = _SESSION.get(ig_url, params=ig_params, timeout=GRAPH_TIMEOUT)
         response.raise_for_status()
         
         data = response.json()
@@ -352,6 +406,7 @@ def get_facebook_config():
     print("-" * 70)
     print()
     
+    page_token_expiry = None
     if app_secret:
         print("🔄 Exchanging for long-lived token...")
         
@@ -364,7 +419,7 @@ def get_facebook_config():
         }
         
         try:
-            response = requests.get(exchange_url, params=exchange_params)
+            response = _SESSION.get(exchange_url, params=exchange_params, timeout=GRAPH_TIMEOUT)
             response.raise_for_status()
             
             exchange_data = response.json()
@@ -374,6 +429,8 @@ def get_facebook_config():
             
             if long_lived_token:
                 page_access_token = long_lived_token
+                if expires_in:
+                    page_token_expiry = int(time.time()) + expires_in
                 print(f"✅ Long-lived token created! (expires in {days} days)")
             else:
                 print("⚠️  Could not exchange token. Using short-lived token.")
@@ -394,6 +451,7 @@ def get_facebook_config():
     # Update settings
     api_keys['facebook_page_access_token'] = page_access_token
     api_keys['facebook_page_id'] = page_id_found
+    api_keys['facebook_page_access_token_expiry'] = page_token_expiry
     
     if app_secret:
         api_keys['facebook_app_secret'] = app_secret
@@ -413,6 +471,7 @@ def get_facebook_config():
             
             config['api_keys']['facebook_page_access_token'] = page_access_token
             config['api_keys']['facebook_page_id'] = page_id_found
+            config['api_keys']['facebook_page_access_token_expiry'] = page_token_expiry
             
             if app_secret:
                 config['api_keys']['facebook_app_secret'] = app_secret
@@ -454,7 +513,7 @@ def get_facebook_config():
 
 if __name__ == '__main__':
     try:
-        success = get_facebook_config()
+        success = get_facebook_config(force='--force' in sys.argv)
         sys.exit(0 if success else 1)
     except KeyboardInterrupt:
         print("\n\n❌ Cancelled by user.")